@@ -1,30 +1,104 @@
 """Methods and Classes providing functionality for Builder mechanism."""
+import six
+from six.moves import intern
 
 """
 Builder() is a "class factory" that creates classes
 """
 
-class BaseMeta(object):
-    def _check(self, attr, value):
-        if attr in self.defaults:
-            if not isinstance(value, self.defaults[attr]):
-                raise TypeError('%s cannot be %s' % (attr, type(value)))
-        else:
-            self.defaults[attr] = type(value)
-    def __setattr__(self, attr, value):
-        self._check(attr, value)
-        super(BaseMeta, self).__setattr__(attr, value)
+def _definitionTypes(definition, fields=None):
+    """Returns the ((field, type), ...) pairs declared by a _DEFINITION object.
+
+    If fields (a model's _FIELDS tuple) is given, only those names are read
+    off the definition; otherwise its class dict is scanned for public names.
+    Field names are interned so the per-set dict lookups in _check hit the
+    identity fast path.
+    """
+    if definition is None:
+        return ()
+    def_type = type(definition)
+    if fields is not None:
+        return tuple((intern(k), getattr(def_type, k)) for k in fields)
+    return tuple((intern(k), v)
+                 for k, v in sorted(vars(def_type).items())
+                 if not k.startswith('_'))
+
+
+_UNSET = object()
+
+
+class Typed(object):
+    """Data descriptor that type-checks a field and stores it in a slot."""
+    __slots__ = ('name', 'type', '_get', '_set')
+
+    def __init__(self, name, field_type, slot):
+        self.name = name
+        self.type = field_type
+        self._get = slot.__get__
+        self._set = slot.__set__
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return self._get(obj, owner)
+
+    def __set__(self, obj, value):
+        if not isinstance(value, self.type):
+            raise TypeError('%s cannot be %s' % (self.name, type(value)))
+        self._set(obj, value)
+
+
+def _makeInit(cls, field_types):
+    """Generates an __init__ with the _DEFINITION type checks inlined.
+
+    Each field becomes a keyword argument checked with a direct isinstance
+    call and written straight to its slot, so construction does not go
+    through the Typed descriptors one attribute at a time.
+    """
+    names = sorted(field_types)
+    ns = {'_UNSET': _UNSET}
+    args = ['self'] + ['%s=_UNSET' % name for name in names]
+    lines = ['def __init__(%s):' % ', '.join(args)]
+    for name in names:
+        ns['_t_' + name] = field_types[name]
+        ns['_s_' + name] = getattr(cls, '_' + name).__set__
+        lines.extend([
+            '    if %s is not _UNSET:' % name,
+            '        if not isinstance(%s, _t_%s):' % (name, name),
+            '            raise TypeError(%r %% type(%s))' % (
+                name + ' cannot be %s', name),
+            '        _s_%s(self, %s)' % (name, name)])
+    if not names:
+        lines.append('    pass')
+    exec(compile('\n'.join(lines) + '\n', '<builder %s>' % ', '.join(names),
+                 'exec'), ns)
+    return ns['__init__']
+
 
 class Meta(type):
-    def __new__(meta, name, bases, dict):
-        cls = type.__new__(meta, name, (BaseMeta,) + bases, dict)
-        cls.defaults = {name: type(value) for name, value in dict.items()}
+    def __new__(meta, name, bases, dct):
+        # Field types are fixed by _DEFINITION, so each field gets a slot and
+        # a Typed descriptor in front of it; instances carry no __dict__.
+        if '_DEFINITION' in dct:
+            field_types = _definitionTypes(dct['_DEFINITION'],
+                                           dct.get('_FIELDS'))
+        else:
+            field_types = ()
+        dct.setdefault('__slots__', tuple('_' + k for k, _ in field_types))
+        cls = type.__new__(meta, name, bases, dct)
+        if '_DEFINITION' in dct:
+            cls._field_types_tuple = field_types
+            cls._field_types = dict(field_types)
+            for k, v in field_types:
+                setattr(cls, k, Typed(k, v, getattr(cls, '_' + k)))
+            if '__init__' not in dct:
+                cls.__init__ = _makeInit(cls, cls._field_types)
         return cls
 
-class BaseModel(object):
-    __metaclass__ = Meta
+class BaseModel(six.with_metaclass(Meta, object)):
     # Shared Model methods.
-    pass
+    _field_types_tuple = ()
+    _field_types = {}
 
 
 class ModelDef(object):
@@ -36,8 +110,4 @@ class ModelDef(object):
 
 class MyModel(BaseModel):
   _DEFINITION = ModelDef()
-
-  def __init__(self, **kwargs):
-    for k,v in kwargs:
-      self[k] = v
-
+  _FIELDS = ('height', 'width', 'path', 'size')
@@ -1,6 +1,4 @@
 """Methods and Classes providing functionality for Builder mechanism."""
-import collections
-
 from core._system import constants
 
 """
@@ -73,10 +71,10 @@ class Builder(object):
   #   pass
 
   def __init__(self):
-    self._dict = collections.defaultdict(list)
+    self._dict = {}  # Currently unused.
     self.name = self.__class__.__name__
     # self.parent_loc = where am I being initialized?
-    self.ignore_paths = []  # local paths/branches to ignore during Discovery.
+    self.ignore_paths = ()  # local paths/branches to ignore during Discovery.
 
   # def build(self):
   #   """Initiates object build."""
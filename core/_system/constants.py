@@ -1,22 +1,31 @@
-import datetime
 import dateutil.tz as tz
 import importlib
 
 import os
 import inspect
 import sys
+import time
+
+from six.moves import intern
 
 IMPORTER = importlib.import_module
 CRITICALFAIL_MSG = ('CRITICAL FAILURE!!! MISSING SYSTEM.PY FILE IN "core.errors_old.err_msg"\n'
                     'Exiting...')
-ROOT_PATH = os.path.abspath('.').replace('\\', '/')
-ERROR_PATH = ROOT_PATH + '/errors_old'
-DATA_PATH = ROOT_PATH + '/data'
-LOG_PATH = DATA_PATH + '/logs'
+
+
+def _systemPaths():
+  """Returns the interned (root, error, data, log) paths from a single getcwd()."""
+  root = os.getcwd().replace('\\', '/')
+  data = root + '/data'
+  return tuple(intern(path) for path in
+               (root, root + '/errors_old', data, data + '/logs'))
+
+ROOT_PATH, ERROR_PATH, DATA_PATH, LOG_PATH = _systemPaths()
 
 LOCAL_TIMEZONE = tz.tzlocal()
 UTC_TIMEZONE = tz.tzutc()
-LOCAL_TIMEZONE_STR = datetime.datetime.now(tz.tzlocal()).tzname()
+# time.tzname is already populated by the C runtime; no datetime needed.
+LOCAL_TIMEZONE_STR = time.tzname[time.localtime().tm_isdst > 0]
 
 ERRORKEY_DEFAULTKEYS = ('basekey', 'localkey', 'msgkey')
 ERRORKEY_SYSTEM_DEFAULTKEYS = ('System', 'Generic', 'Defaultmsg')
\ No newline at end of file
@@ -73,7 +73,7 @@ class _MessageClass(_DefinitionClass):
       # Must not use iteritems because this loop will change the state of dct.
       for key, field_type in dct.items():
 
-        if key in constants._RESERVED_ATTRIBUTE_NAMES:
+        if key in constants._RESERVED_ATTRIBUTE_NAMES or key == '__slots__':
           continue
 
         if isinstance(field_type, type) and issubclass(field_type, Enum):
@@ -111,6 +111,10 @@ class _MessageClass(_DefinitionClass):
       if messages:
         dct['__messages__'] = sorted(messages)
 
+      # Field values live in Message.__tags, so sub-classes need no
+      # per-instance __dict__ of their own unless they ask for slots.
+      dct.setdefault('__slots__', ())
+
     dct['_Message__by_number'] = by_number
     dct['_Message__by_name'] = by_name
 
@@ -181,6 +185,8 @@ class Message(object):
     order.check_initialized()
   """
   __metaclass__ = _MessageClass
+  __slots__ = ('__tags', '__unrecognized_fields', '__weakref__')
+
   def __init__(self, **kwargs):
     """Initialize internal messages state.
     Args:
@@ -350,6 +356,16 @@ class Message(object):
       raise TypeError('Variant type %s is not valid.' % variant)
     self.__unrecognized_fields[key] = value, variant
 
+  def __getstate__(self):
+    """Pickle state, in the same form as the former instance __dict__."""
+    return {'_Message__tags': self.__tags,
+            '_Message__unrecognized_fields': self.__unrecognized_fields}
+
+  def __setstate__(self, state):
+    """Restore state saved by __getstate__ (or a pre-slots pickle)."""
+    self.__tags = state['_Message__tags']
+    self.__unrecognized_fields = state.get('_Message__unrecognized_fields', {})
+
   def __setattr__(self, name, value):
     """Change set behavior for messages.
     Messages may only be assigned values that are fields.
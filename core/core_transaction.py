@@ -1,5 +1,24 @@
 
-@utils.positional(1)
+# Sentinel for attributes that may legitimately be set to None.
+_MISSING = object()
+
+
+def _get_context():
+  """Return the current tasklets context.
+
+  tasklets imports this module, so it cannot be imported at the top.  The
+  first call imports it and rebinds _get_context to tasklets.get_context,
+  so later calls skip both the import and the attribute lookup.
+  """
+  global _get_context
+  from . import tasklets
+  _get_context = tasklets.get_context
+  return _get_context()
+
+
+# transaction() and transaction_async() take exactly one positional parameter
+# and no *args, so the interpreter already rejects extra positional arguments
+# with a TypeError; a utils.positional(1) wrapper would only add a call frame.
 def transaction(callback, **ctx_options):
   """Run a callback in a transaction.
 
@@ -44,20 +63,17 @@ def transaction(callback, **ctx_options):
   return fut.get_result()
 
 
-@utils.positional(1)
 def transaction_async(callback, **ctx_options):
   """Run a callback in a transaction.
 
   This is the asynchronous version of transaction().
   """
-  from . import tasklets
-  return tasklets.get_context().transaction(callback, **ctx_options)
+  return _get_context().transaction(callback, **ctx_options)
 
 
 def in_transaction():
   """Return whether a transaction is currently active."""
-  from . import tasklets
-  return tasklets.get_context().in_transaction()
+  return _get_context().in_transaction()
 
 
 @utils.decorator
@@ -122,25 +138,33 @@ def non_transactional(func, args, kwds, allow_existing=True):
     A wrapper for the decorated function that ensures it runs outside a
     transaction.
   """
-  from . import tasklets
-  ctx = tasklets.get_context()
+  ctx = _get_context()
   if not ctx.in_transaction():
     return func(*args, **kwds)
   if not allow_existing:
     raise datastore_errors.BadRequestError(
         '%s cannot be called within a transaction.' % func.__name__)
   save_ctx = ctx
-  while ctx.in_transaction():
+  # Transactional contexts are created from their parent's class, so the
+  # whole chain shares one in_transaction implementation.
+  in_tx = type(ctx).in_transaction
+  while in_tx(ctx):
     ctx = ctx._parent_context
     if ctx is None:
       raise datastore_errors.BadRequestError(
           'Context without non-transactional ancestor')
+  # Imported here, not at module level: tasklets imports this module (see
+  # _get_context), and it is not part of this tree yet.
+  from . import tasklets
+  set_context = tasklets.set_context
+  set_connection = datastore._SetConnection
   save_ds_conn = datastore._GetConnection()
   try:
-    if hasattr(save_ctx, '_old_ds_conn'):
-      datastore._SetConnection(save_ctx._old_ds_conn)
-    tasklets.set_context(ctx)
+    old_ds_conn = getattr(save_ctx, '_old_ds_conn', _MISSING)
+    if old_ds_conn is not _MISSING:
+      set_connection(old_ds_conn)
+    set_context(ctx)
     return func(*args, **kwds)
   finally:
-    tasklets.set_context(save_ctx)
-    datastore._SetConnection(save_ds_conn)
+    set_context(save_ctx)
+    set_connection(save_ds_conn)
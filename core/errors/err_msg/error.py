@@ -1,5 +1,6 @@
 """Error categories and messages specific to the Error Object."""
 
+from six.moves import intern as _intern
 from core.errors.err_msg_utils import *
 from core.errors.core_error import *
 """
@@ -32,48 +33,44 @@ Each LocalKey Message object is added as a child object of the BaseKey.
 
 # BaseKey Properties
 LOCATION = 'core.errors_old.error_handler'
-_local_location = LOCATION + '.Errors'
+_local_location = _intern(LOCATION + '.Errors')
 
 """
-LocalKey Template:
+LocalKey Table:
 
-xx_localkey_name_xx=LocalKey(
-    desc='',
-    location=_local_location,
-    messages=[
-        errmsg('xx_msgkey_xx', 'xx_message')
-    ]
-)
-"""
+Each row is (localkey_name, desc, messages), where messages is a tuple of
+msgkey() argument tuples.  localkeys() turns the table into LocalKey
+Messages in one pass; they are then published as module attributes.
 
-Generic = LocalKey(
-    desc='Generic LocalKey for Error BaseKey Object.',
-    location=_local_location,
-    messages=[
-        msgkey('GENERICKEY', 'This key not to be used in messaging.'),
-        msgkey('UNKNOWN_ERRORKEY', 'Encountered unexpected key: %s'),
-        msgkey('DEFAULTKEY', 'Generic Error Message'),
-        msgkey('UNEXPECTED_DEFAULT', 'Encountered unexpected default key(s): %s')
-    ]
+_LOCALKEYS = (
+    ('xx_localkey_name_xx', 'xx_desc_xx', (
+        ('xx_msgkey_xx', 'xx_message_xx'),
+    )),
 )
+"""
 
-Validation = LocalKey(
-    desc='Validation-related LocalKey for Error BaseKey Object.',
-    location=_local_location,
-    messages=[
-        msgkey('UNKNOWN', 'An unknown error has caused an exception: %s', ValidationError),
-        msgkey('INVALIDKEY', 'Encountered invalid error key: %s'),
-    ]
+_LOCALKEYS = (
+    ('Generic', 'Generic LocalKey for Error BaseKey Object.', (
+        ('GENERICKEY', 'This key not to be used in messaging.'),
+        ('UNKNOWN_ERRORKEY', 'Encountered unexpected key: %s'),
+        ('DEFAULTKEY', 'Generic Error Message'),
+        ('UNEXPECTED_DEFAULT', 'Encountered unexpected default key(s): %s'),
+    )),
+    ('Validation', 'Validation-related LocalKey for Error BaseKey Object.', (
+        ('UNKNOWN', 'An unknown error has caused an exception: %s',
+         ValidationError),
+        ('INVALIDKEY', 'Encountered invalid error key: %s'),
+    )),
+    ('Add', 'Errors.Add()-related LocalKey for Error BaseKey Object.', (
+        ('INVALID_MSGFORMAT', 'Incorrect number of message arguments included '
+                              'with message.  Original message: %s; Args: %s'),
+        ('INVALID_ERRORKEY', 'Invalid ErrorKey included with message.  '
+                             'Original message: %s; Args: %s'),
+    )),
 )
 
+# LocalKey names ErrorMsgManager imports from this page.
+LOCAL_KEYS = tuple(row[0] for row in _LOCALKEYS)
+globals().update(localkeys(_local_location, _LOCALKEYS))
 
-Add=LocalKey(
-    desc='Errors.Add()-related LocalKey for Error BaseKey Object.',
-    location=_local_location,
-    messages=[
-        msgkey('INVALID_MSGFORMAT', 'Incorrect number of message arguments included with '
-                                    'message.  Original message: %s; Args: %s'),
-        msgkey('INVALID_ERRORKEY', 'Invalid ErrorKey included with message.  Original '
-                                   'message: %s; Args: %s')
-    ]
-)
+register_error_base(__name__)
@@ -3,4 +3,6 @@ Read doc_string of error_handler.ErrorMsgManager for more information.
 """
 from core.errors.err_msg_utils import *
 LOCATION = 'core'
+LOCAL_KEYS = ()  # No LocalKeys; ErrorMsgManager adds the default.
 
+register_error_base(__name__)
@@ -1,14 +1,9 @@
 import inspect
-from core_error import *
-
-def _lateimportMessage():
-  from core.base import core_message as cm
-  return cm.Message, cm.MessageField
-
 
-def _lateimportField():
-  from core.base import core_field as cf
-  return cf.StringField, cf.IntegerField
+from six.moves import intern
+from core_error import *
+from core.base.core_message import Message, MessageField
+from core.base.core_field import StringField, IntegerField
 
 
 def listChildren(obj):
@@ -24,9 +19,6 @@ def listChildren(obj):
 
   return child_list
 
-Message, MessageField = _lateimportMessage()
-StringField, IntegerField = _lateimportField()
-
 class ExceptionField(StringField):
    def validate_element(self, value):
 
@@ -62,10 +54,55 @@ class LocalKey(Message):
   messages = MessageField(MsgKey, 4, repeated=True)
 
 def msgkey(key, value, exception=None):
-  return MsgKey(key=key, message=value, exception=exception)
+  return MsgKey(key=intern(key), message=value, exception=exception)
 
 
 def localkey(key, desc=None, location=None, messages=None):
-  return LocalKey(key=key, desc=desc, location=location, messages=messages)
+  return LocalKey(key=intern(key), desc=desc,
+                  location=location and intern(location), messages=messages)
+
+
+# LocalKeys built by localkeys(), keyed on (location, name, desc, messages).
+_LOCALKEY_CACHE = {}
+
+
+def localkeys(location, table):
+  """Builds {name: LocalKey} from rows of (name, desc, messages).
+
+  messages is a tuple of msgkey() argument tuples; every LocalKey built
+  from the table shares the same (interned) location.  Rows are plain
+  hashable tuples, so re-importing an err_msg page reuses the LocalKeys
+  built the first time instead of constructing new Messages.
+  """
+  location = location and intern(location)
+  result = {}
+  for name, desc, messages in table:
+    cache_key = (location, name, desc, messages)
+    lclkey = _LOCALKEY_CACHE.get(cache_key)
+    if lclkey is None:
+      lclkey = _LOCALKEY_CACHE[cache_key] = LocalKey(
+          desc=desc, location=location,
+          messages=[msgkey(*msg) for msg in messages])
+    result[name] = lclkey
+  return result
+
+
+# Module names of the err_msg pages, in import order.  Each page registers
+# itself, so ErrorMsgManager needs no directory scan to find them.
+_REGISTERED_BASES = []
+
+
+def register_error_base(module_name):
+  """Registers an err_msg page (pass its __name__) as a BaseKey source."""
+  if module_name not in _REGISTERED_BASES:
+    _REGISTERED_BASES.append(intern(module_name))
+  return module_name
+
+
+def registered_error_bases():
+  """Returns the module names of all registered err_msg pages."""
+  return tuple(_REGISTERED_BASES)
+
 
-__all__ = ['localkey', 'msgkey', 'LocalKey', 'MsgKey', 'listChildren']
+__all__ = ['localkey', 'localkeys', 'msgkey', 'LocalKey', 'MsgKey',
+           'listChildren', 'register_error_base', 'registered_error_bases']
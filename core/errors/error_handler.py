@@ -1,14 +1,23 @@
 """Data structure for collecting error messages."""
 
+import bisect
 import collections
-import copy
+import importlib
 import inspect
+import itertools
 import json
-import pprint
+import operator
+import sys
 
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+from six.moves import intern
 from core.utils import file_util
 from core._system.constants import *
-from core.errors.err_msg_utils import *
+from core.errors.err_msg_utils import listChildren, registered_error_bases
 from core.errors import error_handler_utils as util
 from core.errors.core_error import *
 from core import core_utils
@@ -27,32 +36,103 @@ MESSAGE_KEY: Abbr. Error Description
 """
 
 _ERRMSG_LOCATION = '/err_msg'
+_KEYCHAIN_CACHE_SIZE = 1024  # Max resolved key strings kept by ErrMsg.
+
+if orjson is not None:
+  def _dumps(obj):
+    """Serializes obj to a compact JSON string."""
+    return orjson.dumps(obj).decode('utf-8')
+else:
+  def _dumps(obj):
+    """Serializes obj to a compact JSON string."""
+    return json.dumps(obj, separators=(',', ':'))
+
+
 def _repr_(slf):
   """Same repr used by ErrorMsgManager and BaseErrorKey"""
-  title = 'ErrorMsgManager'
-  func = lambda s, v: ', '.join(getattr(s, v) or [] if hasattr(s, v) else [])
-  key_list = func(slf, '_keys')
-  comps = func(slf, '_comps')
-  comp_str = '<{0} (comp: [{1}]'.format(title, comps)
-  key_str = '; keys: [{0}]'.format(key_list)
-  if key_list:
-    comp_str += key_str
+  text = getattr(slf, '_repr_str', None)
+  if text is None:
+    comps = ', '.join(getattr(slf, '_comps', None) or ())
+    key_list = ', '.join(getattr(slf, '_keys', None) or ())
+    if key_list:
+      text = '<ErrorMsgManager (comp: [%s]; keys: [%s])>' % (comps, key_list)
+    else:
+      text = '<ErrorMsgManager (comp: [%s])>' % comps
+    if getattr(slf, '_initialized', False):
+      # A finished key no longer changes; keep its repr.
+      object.__setattr__(slf, '_repr_str', text)
+  return text
 
-  return '{0})>'.format(comp_str)
+
+def _formatChunks(self, args):
+  """MsgKey.format: self.message % args, joined from the pre-split chunks.
+
+  Templates with '%' directives other than '%s' have no chunks and go
+  through '%' itself.
+  """
+  chunks = self._chunks
+  if chunks is None:
+    return self.message % tuple(args)
+  slots = len(chunks) - 1
+  if len(args) != slots:
+    # Same errors '%' raises.
+    raise TypeError('not enough arguments for format string'
+                    if len(args) < slots else
+                    'not all arguments converted during string formatting')
+  parts = [chunks[0]]
+  for arg, chunk in zip(args, chunks[1:]):
+    # '%s' rather than str(), so unicode args give a unicode message.
+    parts.append('%s' % (arg,))
+    parts.append(chunk)
+  return ''.join(parts)
+
+
+# Attributes _import_localkey() loads onto each LocalKey.
+_LOCALKEY_FIELDS = ('description', 'location', '_comps', '_keys')
+# Attributes _import_messagekeys() loads onto each MsgKey; they are slots, so
+# MsgKeys (the bulk of all keys) carry no instance __dict__.
+_MSGKEY_FIELDS = ('message', 'argcount', '_chunks', '_comps', 'exception',
+                  '_msgobj')
+_MSGKEY_SLOTS = _MSGKEY_FIELDS + ('_initialized', '_repr_str')
 
 
 class BaseErrorKey(object):
+    __slots__ = ()
 
     def __setattr__(self, name, value):
-      if not self._initialized:
+      # MsgKey's _initialized is an unset slot until loading finishes.
+      if not getattr(self, '_initialized', False):
         object.__setattr__(self, name, value)
 
-    def __repr__(self):
-      return _repr_(self)
+    __repr__ = _repr_
 
     def _load(self, dict):
       return util.dictToInstance(self, dict)
 
+
+# One class per key layer, shared by every ErrorMsgManager.  BaseKeys and
+# LocalKeys get their children as attributes named after the err_msg
+# entries, so only the leaf MsgKey can use fixed slots.
+class BaseKey(BaseErrorKey):
+    # Attributes come from each page, so loading uses the generic _load.
+    _initialized = False
+    _keys = []
+    _comps = ()
+
+
+class LocalKey(BaseErrorKey):
+    _initialized = False
+    _keys = []
+    _comps = ()
+    _load = util.makeLoader(_LOCALKEY_FIELDS)
+
+
+class MsgKey(BaseErrorKey):
+    __slots__ = _MSGKEY_SLOTS
+    format = _formatChunks
+    _load = util.makeLoader(_MSGKEY_FIELDS)
+
+
 class ErrorMsgManager(object):
   """Collects and organizes error messages into object structure.
   Crawls through errors_old.err_msg directory and imports each file
@@ -95,8 +175,7 @@ class ErrorMsgManager(object):
   <class 'core.errors_old.error_handler.ErrorMsgManager'>
   """
 
-  def __repr__(self):
-    return _repr_(self)
+  __repr__ = _repr_
 
 
   def _import_basekey(self, page_module, basekey):
@@ -119,9 +198,9 @@ class ErrorMsgManager(object):
     basekey_dict = dict([(k, v) for k, v in attr] +   # Load all Attributes
                         zip(['_keys', '_comps'],
                             [[core_utils.convertAllCaps(x[0]) for x in lcl_keys] or [],  # local_keys
-                             [basekey]]))                                  # components
+                             (basekey,)]))                                 # components
 
-    Basekey = self._BaseKey__class()  # Dynamically created in _createErrorMsgKeys()
+    Basekey = BaseKey()
 
     Basekey._load(basekey_dict)
 
@@ -142,17 +221,17 @@ class ErrorMsgManager(object):
           msgkey_list: list, List of MessageKey messages.
       """
     lclkey_name, lclmsg = lcl
-    lclkey_name = core_utils.convertAllCaps(lclkey_name)
+    lclkey_name = intern(core_utils.convertAllCaps(lclkey_name))
     # Aggregate attributes into a dict.
     local_dict = {
       'description': lclmsg.desc,
       'location': lclmsg.location,
-      '_comps': [basekey_obj._comps[0], lclkey_name],
+      '_comps': (basekey_obj._comps[0], lclkey_name),
       '_keys': [core_utils.convertAllCaps(message.key) for message in lclmsg.messages]
     }
 
     # Create LocalKey Object and load its attributes.
-    localkey_obj = self._LocalKey__class()  # Dynamically created in _createErrorMsgKeys()
+    localkey_obj = LocalKey()
     localkey_obj._load(local_dict)
 
     # Assign LocalKey object to BaseKey.
@@ -169,15 +248,20 @@ class ErrorMsgManager(object):
       """
 
     # Aggregate MsgKey attributes into a dict.
+    # The template is split on '%s' once here, so formatting in Errors.Add
+    # is a join rather than a fresh parse of the format string.
+    chunks = tuple(msg_obj.message.split('%s'))
     msg_dict = {'message': msg_obj.message,
-                'argcount': msg_obj.message.count('%s'),
-                '_comps': local_obj._comps + [msg_obj.key],
+                'argcount': len(chunks) - 1,
+                # Only plain '%s' templates can be joined; see _formatChunks.
+                '_chunks': None if '%' in ''.join(chunks) else chunks,
+                '_comps': local_obj._comps + (intern(msg_obj.key),),
                 'exception': msg_obj.exception,
                 '_msgobj': msg_obj
                 }
 
     # Create MessageKey Object and load its attributes
-    msgkey_obj = self._MsgKey__class()  # Dynamically created in _createErrorMsgKeys()
+    msgkey_obj = MsgKey()
     msgkey_obj._load(msg_dict)
     msgkey_obj._initialized = True
 
@@ -185,103 +269,165 @@ class ErrorMsgManager(object):
     # Assign it to parent LocalKey.
     setattr(local_obj, core_utils.convertAllCaps(msg_obj.key), msgkey_obj)
 
-  def _createErrorMsgKeys(self):
-
-    dct = {
-      '_initialized': False,
-      '_keys': [],
-      '_comps': []
-    }
-    for key in ['BaseKey', 'LocalKey', 'MsgKey']:
-
-      setattr(self, '_{0}__class'.format(key),
-              util.createBasicClass(key, (BaseErrorKey,), dct))
-
   def _validateInput(self, default_keys):
     sys_default_keys = ERRORKEY_SYSTEM_DEFAULTKEYS
     err, comps = self, None
     if isinstance(default_keys, list):
 
       use_sysdefaults = False
-      for i, key in enumerate(default_keys):
-        key = key if not use_sysdefaults else sys_default_keys[i]
+      for key, sys_key in zip(default_keys, sys_default_keys):
+        key = key if not use_sysdefaults else sys_key
         if hasattr(err, key):
           err = getattr(err, key)
         else:
           use_sysdefaults = True
-          err = getattr(err, sys_default_keys[i])
+          err = getattr(err, sys_key)
       comps = err._comps
 
     elif isinstance(default_keys, dict):
-      for i, keyword in enumerate(ERRORKEY_DEFAULTKEYS):
-        if keyword in default_keys.keys():
+      for keyword, sys_key in zip(ERRORKEY_DEFAULTKEYS, sys_default_keys):
+        if keyword in default_keys:
           if hasattr(err, default_keys[keyword]):
             err = getattr(err, default_keys[keyword])
           else:
-            err = getattr(err, ERRORKEY_SYSTEM_DEFAULTKEYS[i])
+            err = getattr(err, sys_key)
       comps = err._comps
     else:
-      comps = list(ERRORKEY_SYSTEM_DEFAULTKEYS)
+      comps = list(sys_default_keys)
 
     self.default_keys = comps
 
   def __init__(self, error_keys=None):
-    self._validateInput(error_keys)
+    # (key_str, add_default) -> resolved key; see getKeyFromString().
+    self._keychain_cache = collections.OrderedDict()
+    self._all_cache = None
+    self._flat = {}  # 'Base[.Local[.Msg]]' -> key object; see _flattenBaseKey().
+    self._pending = {}  # basekey -> err_msg package; see __getattr__().
+    self._comps = None  # Keeps track of Basekey, LocalKey, MsgKey components.
     # Determine relative path to ERRMSG directory
 
     location = file_util.SitRep(__file__)
     msg_path = (location.rel_thisdir + _ERRMSG_LOCATION).replace('/', '.')
 
-    # Read ERRMSG directory; Count each file as a BaseKey
-    self._keys = [core_utils.convertAllCaps(x) for x in file_util.searchDirectory(msg_path)]  # List of file names in /err_msg folder
-    errmsg_mod = __import__(msg_path, fromlist=[x.lower() for x in self._keys])  #import module: core.errors_old.err_msg
+    # Importing the ERRMSG package registers its pages; each is a BaseKey
+    errmsg_mod = importlib.import_module(msg_path)  # core.errors.err_msg
+    self._keys = [intern(core_utils.convertAllCaps(name.rsplit('.', 1)[-1]))
+                  for name in registered_error_bases()]
 
     # Ensure 'system.py' file is there.
     system_check = ERRORKEY_SYSTEM_DEFAULTKEYS[0].lower() in [x.lower() for x in self._keys]
     if system_check:
-      self._createErrorMsgKeys()
-      # Iterate through each file
-      for basekey in self._keys:
-        self._comps = None  # Keeps track of Basekey, LocalKey, MsgKey components.
-
-        # Create BaseKey.
-        basekey_obj, localkey_list = self._import_basekey(errmsg_mod, basekey)
-
-        # If Default Local not in localkey_list, append a default LocalKey
-        localkey_list = util._check_LocalKeyDefault(basekey_obj, localkey_list)
-
-        # Convert LocalKey Messages to Objects:
-        for local_keymsg in localkey_list:
-          lclkey_obj, msgkey_list = self._import_localkey(basekey_obj, local_keymsg)
-
-          # If Default MessageKey not in msgkey_list, append a default MsgKey
-          msgkey_list = util._check_MsgKeyDefault(lclkey_obj, msgkey_list)
-
-          # Convert MessageKey Messages to Objects:
-          for msg in msgkey_list:
-            self._import_messagekeys(lclkey_obj, msg)
-          lclkey_obj._initialized=True
-        basekey_obj._initialized=True
+      # Checked as one isinstance() tuple by _validateKey/_defaultKeyChain.
+      self._key_class_types = (BaseKey, LocalKey, MsgKey, ErrorMsgManager)
+      # Each file becomes a BaseKey the first time it is accessed.
+      self._pending = dict((basekey, errmsg_mod) for basekey in self._keys)
+      self._validateInput(error_keys)
     else:
       print CRITICALFAIL_MSG
       sys.exit(0)
 
+  def __getattr__(self, name):
+    """Builds a pending BaseKey (and its LocalKeys/MsgKeys) on first access."""
+    pending = self.__dict__.get('_pending')
+    if pending and name in pending:
+      try:
+        basekey_obj = self._buildBaseKey(name, pending[name])
+      except Exception:
+        # Leave it pending, so the next access retries and re-raises the
+        # real error instead of finding a half-built BaseKey.
+        self._discardBaseKey(name)
+        raise
+      del pending[name]
+      return basekey_obj
+    raise AttributeError(name)
+
+  def _discardBaseKey(self, name):
+    """Removes whatever a failed _buildBaseKey attached for BaseKey name."""
+    self.__dict__.pop(name, None)
+    prefix = name + '.'
+    for path in [path for path in self._flat
+                 if path == name or path.startswith(prefix)]:
+      del self._flat[path]
+
+  def _buildBaseKey(self, basekey, errmsg_mod):
+    # Create BaseKey.
+    basekey_obj, localkey_list = self._import_basekey(errmsg_mod, basekey)
+
+    # If Default Local not in localkey_list, append a default LocalKey
+    localkey_list = util._check_LocalKeyDefault(basekey_obj, localkey_list)
+
+    # Convert LocalKey Messages to Objects:
+    for local_keymsg in localkey_list:
+      lclkey_obj, msgkey_list = self._import_localkey(basekey_obj, local_keymsg)
+
+      # If Default MessageKey not in msgkey_list, append a default MsgKey
+      msgkey_list = util._check_MsgKeyDefault(lclkey_obj, msgkey_list)
+
+      # Convert MessageKey Messages to Objects:
+      for msg in msgkey_list:
+        self._import_messagekeys(lclkey_obj, msg)
+      lclkey_obj._initialized=True
+    basekey_obj._initialized=True
+    self._flattenBaseKey(basekey, basekey_obj)
+    return basekey_obj
+
   def getKeyFromString(self, key_str, errors=None, add_default=True):
-    """convert dot-based string into Key."""
+    """convert dot-based string into Key.
+
+    The key tree never changes once a BaseKey is built, so lookups that don't
+    report into an Errors object are cached (oldest entries are evicted
+    past _KEYCHAIN_CACHE_SIZE).
+    """
+    if errors is not None:
+      return self._getKeyFromString(key_str, errors, add_default)
+
+    cache = self._keychain_cache
+    cache_key = (key_str, add_default)
+    try:
+      return cache[cache_key]
+    except KeyError:
+      pass
+    new_key = self._getKeyFromString(key_str, None, add_default)
+    if len(cache) >= _KEYCHAIN_CACHE_SIZE:
+      cache.popitem(last=False)
+    cache[cache_key] = new_key
+    return new_key
+
+  def _flattenBaseKey(self, basekey, base):
+    """Indexes a BaseKey and its Local/Msg keys by their dotted names."""
+    flat = self._flat
+    flat[basekey] = base
+    for localkey in base._keys:
+      localkey = core_utils.convertAllCaps(localkey)
+      local = getattr(base, localkey, None)
+      if local is None:
+        continue
+      local_str = basekey + '.' + localkey
+      flat[local_str] = local
+      for msgkey in local._keys:
+        msgkey = core_utils.convertAllCaps(msgkey)
+        msg = getattr(local, msgkey, None)
+        if msg is not None:
+          flat[local_str + '.' + msgkey] = msg
+
+  def _getKeyFromString(self, key_str, errors, add_default):
     if key_str:
-      comps = key_str.split('.')
-      new_key = self
-      for key in comps:
-        if hasattr(new_key, key):
-          new_key=getattr(new_key, key)
-        elif isinstance(errors, Errors):
-          errors.Add(ErrMsg.Error.Validation.Invalidkey, key)
-          return None
-        else:
-          return None
+      new_key = self._flat.get(key_str)
+      if new_key is None:
+        # Not a key path; fall back to walking attributes.
+        new_key = self
+        for key in key_str.split('.'):
+          child = getattr(new_key, key, None)
+          if child is not None:
+            new_key = child
+          elif isinstance(errors, Errors):
+            errors.Add(_ERR_INVALIDKEY, key)
+            return None
+          else:
+            return None
 
       # if key_str is only a partial keychain, add default keys to complete it.
-      if len(comps) < 3 and add_default:
+      if key_str.count('.') < 2 and add_default:
         return self._defaultKeyChain(new_key, errors)
       else:
         return new_key
@@ -291,10 +437,8 @@ class ErrorMsgManager(object):
   def _defaultKeyChain(self, key=None, errors=None):
 
     # Get list of components of key (if any)
-    key_class_types = [self._BaseKey__class, self._LocalKey__class,
-                       self._MsgKey__class, ErrorMsgManager]
-    chain = (key._comps if any(
-      [isinstance(key, cls) for cls in key_class_types]) else None) or []
+    chain = list((key._comps if isinstance(key, self._key_class_types)
+                  else None) or [])
 
     chain += self.default_keys[len(chain):]
     return self.getKeyFromString('.'.join(chain))
@@ -302,17 +446,14 @@ class ErrorMsgManager(object):
   def _validateKey(self, key, cls = None):
     """"Verify that key is an instance of some ErrorKey or ErrMsgManager class."""
 
-    key_class_types = [self._BaseKey__class, self._LocalKey__class,
-                       self._MsgKey__class, ErrorMsgManager]
+    key_class_types = self._key_class_types
 
     if cls:
       if inspect.isclass(cls) and cls in key_class_types:
-        classes = [cls]
+        return isinstance(key, cls)
       else:
         return None
-    else:
-      classes = key_class_types
-    return any([isinstance(key, cls) for cls in classes])
+    return isinstance(key, key_class_types)
 
   def isValidKey(self, key, cls=None, errors=None):
     isvalid = self._validateKey(key, cls)
@@ -325,111 +466,148 @@ class ErrorMsgManager(object):
 
   @property
   def all(self):
+      """Ordered dict of every MsgKey to its message, built on first access."""
+      if self._all_cache is None:
+          self._all_cache = self._computeAll()
+      return self._all_cache
+
+  def _computeAll(self):
       all_messages = collections.OrderedDict()
       for basekey in sorted(self._keys):
           base = getattr(self, basekey)
           for localkey in sorted(base._keys):
               local = getattr(base, localkey)
               for msgkey in sorted(local._keys):
-                  msg = getattr(local, msgkey).message
-                  keychain = self.getKeyFromString('.'.join([basekey, localkey, msgkey]))
-                  all_messages[str(keychain)] = msg
+                  # The triple is complete, so the MsgKey is the keychain.
+                  keychain = getattr(local, msgkey)
+                  all_messages[str(keychain)] = keychain.message
       return all_messages
 
 
 ErrMsg = ErrorMsgManager()
+# Keys the error paths report with; the key tree is fixed, so bind them once.
+_ERR_INVALIDKEY = ErrMsg.Error.Validation.Invalidkey
+_ERR_INVALID_MSGFORMAT = ErrMsg.Error.Add.Invalid_Msgformat
+_ERR_INVALID_ERRORKEY = ErrMsg.Error.Add.Invalid_Errorkey
+
 
 class Errors(object):
   DEFAULT_FMT = '\n'.join
 
   def __init__(self):
+    # Flat {(basekey, localkey, msgkey): [messages]}; key._comps is the key.
     self._errors = {}
+    self._sorted_keys = []  # _errors' keys, kept sorted as they are added.
+    # The same lists indexed {basekey: {localkey: {msgkey: [messages]}}}.
+    self._by_base = {}
     self._exceptions = []
+    self._version = 0  # Bumped on every change to _errors.
+    self._views = (None, None, None)  # (version, condensed, consists_of)
+
+  def _messages(self, comps):
+    """Returns the message list for comps, filing a new one if needed."""
+    msglist = self._errors.get(comps)
+    if msglist is None:
+      msglist = self._file(comps, [])
+      bisect.insort(self._sorted_keys, comps)
+    return msglist
+
+  def _file(self, comps, msglist):
+    """Files msglist under comps in both _errors and _by_base."""
+    basekey, localkey, msgkey = comps
+    self._errors[comps] = msglist
+    local = self._by_base.setdefault(basekey, {}).setdefault(localkey, {})
+    local[msgkey] = msglist
+    return msglist
+
+  def _nested(self):
+    """Returns a copy of _by_base whose dicts callers may change freely."""
+    return dict((basekey, dict((localkey, dict(local))
+                               for localkey, local in base.iteritems()))
+                for basekey, base in self._by_base.iteritems())
 
   def __nonzero__(self):
     return bool(self._errors)
 
   def __contains__(self, key):
-    return key in self._errors
+    return key in self._by_base
 
   def __len__(self):
-    return sum(len(messages) for messages in self._errors.itervalues())
+    return sum(map(len, self._by_base.itervalues()))
 
   def __iter__(self):
-    return iter(self._errors)
+    return iter(self._by_base)
 
   def __repr__(self):
-    return '<Errors: %s>' % pprint.pformat(dict(self._errors))
+    return '<Errors: %s>' % json.dumps(self._by_base, indent=2, sort_keys=True,
+                                        default=str)
 
   @property
   def count(self):
-    return sum(len(x) for x in self.condensed.values())
+    return sum(map(len, self._errors.itervalues()))
 
   @property
   def condensed(self):
     """Condenses nested dict to single dict."""
-    condensed = {}
-    key_format = '{0}_{1}_{2}'
-    for basekey, basevalue in sorted(self._errors.iteritems()):
-      for localkey, localvalue in sorted(basevalue.iteritems()):
-        for msgkey, msglist in sorted(localvalue.iteritems()):
-          new_key = key_format.format(basekey, localkey, msgkey)
-          condensed[new_key] = msglist
-    return condensed
+    # A copy, so changes by the caller don't leak into the cached view.
+    return dict(self._buildViews()[1])
 
   @property
   def consists_of(self):
-    d = collections.defaultdict(list)
-    for basekey, basevalue in sorted(self._errors.iteritems()):
-      d[ERRORKEY_DEFAULTKEYS[0]].append(basekey)
-      for localkey, localvalue in sorted(basevalue.iteritems()):
-        d[ERRORKEY_DEFAULTKEYS[1]].append('.'.join([basekey, localkey]))
-        for msgkey, _ in sorted(localvalue.iteritems()):
-          d[ERRORKEY_DEFAULTKEYS[2]].append('.'.join([basekey, localkey, msgkey]))
-    return dict(d)
+    d = self._buildViews()[2]
+    return dict((tag, list(names)) for tag, names in d.iteritems())
 
-  @property
-  def display(self):
-    d = ''
-    for basekey, basevalue in sorted(self._errors.iteritems()):
-      d += basekey + '\n'
-      for localkey, localvalue in sorted(basevalue.iteritems()):
-        d += ' ' * 4 + localkey + '\n'
-        for msgkey, msglist in sorted(localvalue.iteritems()):
-          temp_list = copy.copy(msglist)
-          first_msg = temp_list.pop(0)
-          d += '{0}{1}: {2}'.format(' ' * 10, msgkey, first_msg) + '\n'
-          for msg in temp_list:
-            d += ' ' * (12 + len(msgkey)) + msg + '\n'
-          d += '\n'
-    return d
-
-  def _keychainExists(self, key, create_new=False):
-    """Confirms if key already exists in error dictionary.
-    Args:
-        key, an ErrorKey subclass, key to be searched.
-        create_new: bool, if key doesn't exist in error, create new one.
+  def _buildViews(self):
+    """Builds condensed and consists_of in one sweep of _sorted_keys.
+
+    The result is kept until _errors next changes (see _version).
     """
-    if ErrMsg._validateKey(key):
-      curr_dict = self._errors
+    if self._views[0] != self._version:
+      condensed = {}
+      key_format = '{0}_{1}_{2}'
+      d = collections.defaultdict(list)
+      base_tag, local_tag, msg_tag = ERRORKEY_DEFAULTKEYS[:3]
+      last_base = last_local = None
+      for comps in self._sorted_keys:
+        basekey, localkey, msgkey = comps
+        if basekey != last_base:
+          d[base_tag].append(basekey)
+          last_base, last_local = basekey, None
+        if localkey != last_local:
+          d[local_tag].append('.'.join([basekey, localkey]))
+          last_local = localkey
+        condensed[key_format.format(basekey, localkey, msgkey)] = self._errors[comps]
+        d[msg_tag].append('.'.join(comps))
+      self._views = (self._version, condensed, dict(d))
+    return self._views
 
-      for i, comp in enumerate(key._comps):
-        create_type = dict if i < 2 else list
-        if comp in curr_dict.keys():
-          curr_dict = curr_dict[comp]
-        else:
-          if create_new:
-            curr_dict[comp] = create_type()
-            curr_dict = curr_dict[comp]
-          else:
-            return False
-      return True
+  @property
+  def display(self):
+    parts = []
+    append = parts.append
+    errors = self._errors
+    by_base, by_local = operator.itemgetter(0), operator.itemgetter(1)
+    for basekey, base_group in itertools.groupby(self._sorted_keys, by_base):
+      append(basekey + '\n')
+      for localkey, local_group in itertools.groupby(base_group, by_local):
+        append(' ' * 4 + localkey + '\n')
+        for comps in local_group:
+          msgkey, msglist = comps[2], errors[comps]
+          append('{0}{1}: {2}\n'.format(' ' * 10, msgkey, msglist[0]))
+          indent = ' ' * (12 + len(msgkey))
+          for msg in itertools.islice(msglist, 1, None):
+            append(indent + msg + '\n')
+          append('\n')
+    return ''.join(parts)
 
   def isError(self, obj):
     return isinstance(obj, Errors) or issubclass(obj, Errors)
 
   def Clear(self):
     self._errors = {}
+    self._sorted_keys = []
+    self._by_base = {}
+    self._version += 1
 
 
   def Get(self, key):
@@ -444,14 +622,14 @@ class Errors(object):
     """
     if not key:
       key = ERRORKEY_SYSTEM_DEFAULTKEYS[0]
-    messages = self._errors.get(key)
+    messages = self._by_base.get(key)
     if messages:
       return list(messages)
     return None
 
   def GetAll(self):
     """Gets a copy of the internal errors_old dictionary."""
-    return self._errors.copy()
+    return self._nested()
 
   def _validateException(self, exception):
     if isinstance(exception, str):
@@ -467,9 +645,9 @@ class Errors(object):
       return None
 
   def _add(self, key, args):
-    basekey, localkey, msgkey = key._comps
-    message = key.message % args if key.argcount > 0 else key.message
-    self._errors[basekey][localkey][msgkey].append(message)
+    message = key.format(args) if key.argcount > 0 else key.message
+    self._messages(key._comps).append(message)
+    self._version += 1
 
 
   def Add(self, key, *args):
@@ -479,29 +657,26 @@ class Errors(object):
       key: str, the ke to associate with a message. 
       *args: additional messages to associate with the key.
     """
-    temp_error = Errors()
-    if ErrMsg.isValidKey(key, ErrMsg._MsgKey__class, temp_error):
+    if ErrMsg.isValidKey(key, MsgKey):
       if key.argcount != len(args):
-        if not self._keychainExists(key):
-          self._keychainExists(key, True)
         exception = self._validateException(key.exception)
         if exception:
           self.Raise(exception, key, args)
         else:
           self._add(key, args)
       else:
-        self.Add(ErrMsg.Error.Add.Invalid_Msgformat, key.message, args)
+        self.Add(_ERR_INVALID_MSGFORMAT, key.message, args)
 
-    elif ErrMsg.isValidKey(key, None, temp_error):
+    elif ErrMsg.isValidKey(key):
       # Assume GENERIC status
-
+      temp_error = Errors()
       key = ErrMsg._defaultKeyChain(key, temp_error)
       if temp_error:
         pass
       else:
         self.Add(key, args)
     else:
-      self.Add(ErrMsg.Error.Add.Invalid_Errorkey, key.message, args)
+      self.Add(_ERR_INVALID_ERRORKEY, key.message, args)
 
   def AsJson(self):
     """Gets a JSON string representation of the error object.
@@ -516,7 +691,7 @@ class Errors(object):
       A JSON string of key_bk/messages pairs.
     """
 
-    return json.dumps(self._errors)
+    return _dumps(self._by_base)
 
   def Merge(self, other):
     """Adds all errors_old from another Errors object to this one.
@@ -525,17 +700,17 @@ class Errors(object):
       other: an Errors instance to merge into this one.
     """
     if self.isError(other):
-      for basekey, basevalue in other._errors.iteritems():
-        for localkey, localvalue in basevalue.iteritems():
-          for msgkey, msglist in localvalue.iteritems():
-            keychain = ErrMsg.getKeyFromString('.'.join([basekey, localkey,
-                                                         msgkey]))
-
-            # Use keychainExists flag to create chain in self if it doesn't
-            # already exist.
-            self._keychainExists(keychain, True)
-            for msg in msglist:
-              self._errors[basekey][localkey][msgkey].append(msg)
+      if not other._errors:
+        return
+      self._version += 1
+      if not self._errors:
+        # Nothing to merge into; copy the other table in one go.
+        for comps in other._sorted_keys:
+          self._file(comps, list(other._errors[comps]))
+        self._sorted_keys = list(other._sorted_keys)
+        return
+      for comps, msglist in other._errors.iteritems():
+        self._messages(comps).extend(msglist)
 
   def Raise(self, exception, key, *args):
     """Adds error message(s) and raises the given exception."""
@@ -18,35 +18,44 @@ def dictToInstance(_instance, _dict):
     [setattr(_instance, k, v) for k, v in _dict.iteritems()]
     return _instance
 
-def createBasicClass(name, bases=(object,), dct={}):
+def makeLoader(fields):
+    """Generates a _load(self, dict) specialized to a fixed set of fields.
+
+    Equivalent to dictToInstance for dicts holding exactly these keys, but
+    compiled to one straight-line assignment per field, each going straight
+    to object.__setattr__.
+    """
+    lines = ['def _load(self, _dict):']
+    lines.extend('    _setattr(self, %r, _dict[%r])' % (k, k) for k in fields)
+    lines.append('    return self')
+    ns = {'_setattr': object.__setattr__}
+    exec(compile('\n'.join(lines) + '\n', '<_load %s>' % ', '.join(fields),
+                 'exec'), ns)
+    return ns['_load']
+
+def createBasicClass(name, bases=(object,), dct={}, slots=None):
+    if slots is not None:
+        dct = dict(dct, __slots__=tuple(slots))
     cls = type(name, bases, dct)
     return cls
 
 def _getErrmsgData(page):
+    # Each err_msg page registers its LocalKey names in LOCAL_KEYS.
+    local_names = page.LOCAL_KEYS
     data_dict = {
         'description': page.__doc__ if page.__doc__ else '',
-        'local_keys': [],
-        'attributes': []
+        # (Name, LocalKey Message)
+        'local_keys': [[core_utils.convertAllCaps(name), getattr(page, name)]
+                       for name in sorted(local_names)],
+        # Remaining ALL-CAPS names are BaseKey properties: (name, value)
+        # Filtered before sorting; isupper() avoids an upper() copy per name.
+        'attributes': sorted([prop.lower(), value]
+                             for prop, value in vars(page).iteritems()
+                             if not prop.startswith('_') and prop.isupper()
+                             and prop != 'LOCAL_KEYS'
+                             and prop not in local_names)
     }
 
-    # Parse ErrMsg page
-    for prop in [x for x in dir(page) if not x.startswith('_')]:
-        prop_val, key = [core_utils.convertAllCaps(prop),
-                         getattr(page, prop)], None  # Prop: (Name, Value)
-
-        # Filter prop values
-        if isinstance(prop_val[1], LocalKey):  # Interpret as a LocalKey Message
-            key = 'local_keys'
-            prop_val[0] = core_utils.convertAllCaps(prop_val[0])
-        elif prop == prop.upper():  # Interpret as a BaseKey Property
-            key = 'attributes'
-            prop_val[0] = prop_val[0].lower()
-        else:
-            pass  # Ignore everything else
-
-        if key:
-            data_dict[key].append(prop_val)
-
     if 'location' not in data_dict.keys():
         data_dict['location'] = '(Not Available)'
 
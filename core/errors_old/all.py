@@ -11,6 +11,7 @@ __all__ = [
     # Imported from err_msg_utils.
     'localkey',          #  Method: returns a LocalKey Message-class instance.
     'errmsg',            #  Method: returns an ErrMsg Message-class instance.
+    'register_error_base',  #  Method: registers an err_msg page as a BaseKey.
 
     # Imported from core_error.
     'Error',             #   Class: Base Exception Class.
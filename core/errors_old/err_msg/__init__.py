@@ -1 +1,2 @@
-
+# Importing a page registers it with err_msg_utils.register_error_base().
+from . import error, message, system
@@ -1,41 +1,34 @@
 """Error categories and messages specific to the Error Object.
 Read doc_string of error_handler.ErrorMsgManager for more information.
 """
+from six.moves import intern as _intern
 from core.errors_old.err_msg_utils import *
 
 
 LOCATION = 'core.errors_old.error_handler'
-_local_location = LOCATION + '.Errors'
-GENERIC = localkey('GENERIC',
-                   'Generic local_key for Error Object.',
-                   _local_location,
-                   [])
+_local_location = _intern(LOCATION + '.Errors')
 
-GENERIC.messages = [
-    errmsg('GENERICKEY', 'This key not to be used in messaging.'),
-    errmsg('UNKNOWN_ERRORKEY', 'Encountered unexpected key: %s'),
-    errmsg('DEFAULTKEY', 'Generic Error Message'),
-    errmsg('UNEXPECTED_DEFAULT', 'Encountered unexpected default key(s): %s')
-]
+_LOCALKEYS = (
+    ('GENERIC', 'Generic local_key for Error Object.', (
+        ('GENERICKEY', 'This key not to be used in messaging.'),
+        ('UNKNOWN_ERRORKEY', 'Encountered unexpected key: %s'),
+        ('DEFAULTKEY', 'Generic Error Message'),
+        ('UNEXPECTED_DEFAULT', 'Encountered unexpected default key(s): %s'),
+    )),
+    ('VALIDATION', 'Error Object localkey for Validation errors_old.', (
+        ('UNKNOWN', 'An unknown error has caused an exception: %s'),
+        ('INVALIDKEY', 'Encountered invalid error key: %s'),
+    )),
+    ('ADD', 'Error Object localkey for Add method exceptions.', (
+        ('INVALID_MSGFORMAT', 'Incorrect number of message arguments included '
+                              'with message.  Original message: %s; Args: %s'),
+        ('INVALID_ERRORKEY', 'Invalid ErrorKey included with message.  '
+                             'Original message: %s; Args: %s'),
+    )),
+)
 
+# LocalKey names ErrorMsgManager imports from this page.
+LOCAL_KEYS = tuple(row[0] for row in _LOCALKEYS)
+globals().update(localkeys(_local_location, _LOCALKEYS))
 
-VALIDATION = localkey('VALIDATION',
-                      'Error Object localkey for Validation errors_old.',
-                      _local_location,
-                      [])
-VALIDATION.messages = [
-    errmsg('UNKNOWN', 'An unknown error has caused an exception: %s'),
-    errmsg('INVALIDKEY', 'Encountered invalid error key: %s')
-]
-
-ADD = localkey('ADD',
-               'Error Object localkey for Add method exceptions.',
-               _local_location,
-               [])
-ADD.messages = [
-    errmsg('INVALID_MSGFORMAT', 'Incorrect number of message arguments included with '
-                                'message.  Original message: %s; Args: %s'),
-    errmsg('INVALID_ERRORKEY', 'Invalid ErrorKey included with message.  Original '
-                               'message: %s; Args: %s')
-
-]
+register_error_base(__name__)
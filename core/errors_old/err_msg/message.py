@@ -1,5 +1,9 @@
 """Error categories and messages specific to the Message Object.
 Read doc_string of error_handler.ErrorMsgManager for more information.
 """
+from core.errors_old.err_msg_utils import register_error_base
 
-LOCATION = 'core.base.message'
\ No newline at end of file
+LOCATION = 'core.base.message'
+LOCAL_KEYS = ()  # No LocalKeys; ErrorMsgManager adds the default.
+
+register_error_base(__name__)
@@ -4,13 +4,16 @@ Read doc_string of error_handler.ErrorMsgManager for more information.
 from core.errors_old.err_msg_utils import *
 LOCATION = 'core'
 
-GENERIC = localkey('GENERIC',
-                   'Generic local_key for System Object.',
-                   'core.errors_old',
-                   [])
+_LOCALKEYS = (
+    ('GENERIC', 'Generic local_key for System Object.', (
+        ('DEFAULTMSG', 'Default key for all System errors_old.'),
+        ('UNKNOWN_ERRORKEY', 'Encountered unexpected key: %s'),
+        ('TEMPKEY', 'Generic System error message'),
+    )),
+)
 
-GENERIC.messages = [
-    errmsg('DEFAULTMSG', 'Default key for all System errors_old.'),
-    errmsg('UNKNOWN_ERRORKEY', 'Encountered unexpected key: %s'),
-    errmsg('TEMPKEY', 'Generic System error message')
-]
\ No newline at end of file
+# LocalKey names ErrorMsgManager imports from this page.
+LOCAL_KEYS = tuple(row[0] for row in _LOCALKEYS)
+globals().update(localkeys('core.errors_old', _LOCALKEYS))
+
+register_error_base(__name__)
@@ -1,15 +1,6 @@
-
-def _lateimportMessage():
-  from core.base import core_message as cm
-  return cm.Message, cm.MessageField
-
-
-def _lateimportField():
-  from core.base import core_field as cf
-  return cf.StringField, cf.IntegerField
-
-Message, MessageField = _lateimportMessage()
-StringField, IntegerField = _lateimportField()
+from six.moves import intern
+from core.base.core_message import Message, MessageField
+from core.base.core_field import StringField, IntegerField
 
 
 class ErrMsg(Message):
@@ -24,10 +15,54 @@ class LocalKey(Message):
 
 
 def errmsg(key, value):
-  return ErrMsg(key=key, value=value)
+  return ErrMsg(key=intern(key), value=value)
 
 
 def localkey(key, desc=None, location=None, messages=None):
-  return LocalKey(key=key, desc=desc, location=location, messages=messages)
+  return LocalKey(key=intern(key), desc=desc,
+                  location=location and intern(location), messages=messages)
+
+
+# LocalKeys built by localkeys(), keyed on (location, key, desc, messages).
+_LOCALKEY_CACHE = {}
+
+
+def localkeys(location, table):
+  """Builds {KEY: LocalKey} from rows of (key, desc, messages).
+
+  messages is a tuple of (key, value) errmsg pairs; every LocalKey built
+  from the table shares the same (interned) location.  Rows are plain
+  hashable tuples, so re-importing an err_msg page reuses the LocalKeys
+  built the first time instead of constructing new Messages.
+  """
+  location = location and intern(location)
+  result = {}
+  for key, desc, messages in table:
+    cache_key = (location, key, desc, messages)
+    lclkey = _LOCALKEY_CACHE.get(cache_key)
+    if lclkey is None:
+      lclkey = _LOCALKEY_CACHE[cache_key] = localkey(
+          key, desc, location, [errmsg(*msg) for msg in messages])
+    result[key] = lclkey
+  return result
+
+
+# Module names of the err_msg pages, in import order.  Each page registers
+# itself, so ErrorMsgManager needs no directory scan to find them.
+_REGISTERED_BASES = []
+
+
+def register_error_base(module_name):
+  """Registers an err_msg page (pass its __name__) as a BaseKey source."""
+  if module_name not in _REGISTERED_BASES:
+    _REGISTERED_BASES.append(intern(module_name))
+  return module_name
+
+
+def registered_error_bases():
+  """Returns the module names of all registered err_msg pages."""
+  return tuple(_REGISTERED_BASES)
+
 
-__all__ = ['localkey', 'errmsg']
+__all__ = ['localkey', 'localkeys', 'errmsg', 'register_error_base',
+           'registered_error_bases']
@@ -1,13 +1,25 @@
 """Data structure for collecting error messages."""
 
+from __future__ import print_function
+
+import bisect
 import collections
-import copy
+import importlib
+import itertools
 import json
-import pprint
+import operator
+import sys
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
 
+import six
+from six.moves import intern
 from core.utils import file_util
 from core._system.constants import *
-from core.errors_old.err_msg_utils import errmsg
+from core.errors_old.err_msg_utils import errmsg, registered_error_bases
 
 __all__ = [
   #  Error-related classes/instances
@@ -23,12 +35,97 @@ MESSAGE_KEY: Abbr. Error Description
 """
 
 
+if orjson is not None:
+  def _dumps(obj):
+    """Serializes obj to a compact JSON string."""
+    return orjson.dumps(obj).decode('utf-8')
+else:
+  def _dumps(obj):
+    """Serializes obj to a compact JSON string."""
+    return json.dumps(obj, separators=(',', ':'))
+
+# Insertion-ordered mapping; plain dicts keep insertion order from 3.7 on.
+_OrderedDict = dict if sys.version_info >= (3, 7) else collections.OrderedDict
+
+# Keyword names _defaultKey accepts for its basekey/localkey/msgkey defaults.
+_DEFAULTKEY_NAMES = frozenset(ERRORKEY_DEFAULTKEYS)
+
+
 def _repr_(title, keys=None):
   if keys:
     return '{0}<keys: {1}>'.format(title, (', '.join(keys)))
   else:
     return title
 
+
+class ErrorKey(object):
+  """Base Key object used to create BaseKey, LocalKey, and MessageKey objects."""
+  _DEFAULT_BASEKEY, _DEFAULT_LOCALKEY, _DEFAULT_MSGKEY = ERRORKEY_SYSTEM_DEFAULTKEYS
+  __slots__ = ('_comps', '_str')
+
+  def __init__(self, **kwargs):
+    self._comps = None
+    for k, v in six.iteritems(kwargs):
+      setattr(self, k, v)
+    # A key's name, keys and location are fixed once built; format them once.
+    if hasattr(self, 'name') and hasattr(self, 'keys'):
+      self._str = _repr_(self.name, self.keys)
+    elif hasattr(self, '_location'):
+      self._str = _repr_(self._location)
+    else:
+      self._str = object.__repr__(self)
+
+  def __repr__(self):
+    return self._str
+
+  __str__ = __repr__
+
+  @property
+  def comps(self):
+    return self._comps
+
+
+# BaseKeys and LocalKeys get their child keys as attributes by name, so they
+# keep an instance __dict__.
+class BaseKey(ErrorKey):
+  pass
+
+
+class LocalKey(ErrorKey):
+  pass
+
+
+class MessageKey(ErrorKey):
+  # Leaf keys, the bulk of the catalog, carry no __dict__.
+  __slots__ = ('message', '_location', '_chunks', 'argcount')
+
+  def __init__(self, **kwargs):
+    super(MessageKey, self).__init__(**kwargs)
+    # Split on '%s' once so Errors.Add joins instead of re-parsing.
+    chunks = tuple(getattr(self, 'message', '').split('%s'))
+    self.argcount = len(chunks) - 1
+    # Only plain '%s' templates can be joined; others go through '%'.
+    self._chunks = None if '%' in ''.join(chunks) else chunks
+
+  def format(self, args):
+    """self.message % args, joined from the pre-split chunks."""
+    chunks = self._chunks
+    if chunks is None:
+      return self.message % tuple(args)
+    slots = len(chunks) - 1
+    if len(args) != slots:
+      # Same errors '%' raises.
+      raise TypeError('not enough arguments for format string'
+                      if len(args) < slots else
+                      'not all arguments converted during string formatting')
+    parts = [chunks[0]]
+    for arg, chunk in zip(args, chunks[1:]):
+      # '%s' rather than str(), so unicode args give a unicode message.
+      parts.append('%s' % (arg,))
+      parts.append(chunk)
+    return ''.join(parts)
+
+
 class ErrorMsgManager(object):
   """Collects and organizes error messages into object structure.
   Crawls through errors_old.err_msg directory and imports each file
@@ -60,7 +157,7 @@ class ErrorMsgManager(object):
   >>> mgr.BASE1.LOCAL2.MSGKEY1.argcount
   1
   >>> mgr.BASE1.LOCAL2.MSGKEY1.comps
-  ['BASE1', 'LOCAL2', 'MSGKEY1']
+  ('BASE1', 'LOCAL2', 'MSGKEY1')
   >>> type(mgr.BASE1.LOCAL2.MSGKEY1)
   <class 'core.errors_old.error_handler.MessageKey'>
   >>> type(mgr.BASE1.LOCAL2)
@@ -71,123 +168,135 @@ class ErrorMsgManager(object):
   <class 'core.errors_old.error_handler.ErrorMsgManager'>
   """
 
-  class ErrorKey(object):
-    """Base Key object used to create BaseKey, LocalKey, and MessageKey objects."""
-    _DEFAULT_BASEKEY, _DEFAULT_LOCALKEY, _DEFAULT_MSGKEY = ERRORKEY_SYSTEM_DEFAULTKEYS
-
-    def __init__(self, **kwargs):
-      self._comps = None
-      for k, v in kwargs.iteritems():
-        setattr(self, k, v)
-
-    def __repr__(self):
-      if hasattr(self, 'name') and hasattr(self, 'keys'):
-        return _repr_(self.name, self.keys)
-      elif hasattr(self, '_location'):
-        return _repr_(self._location)
-      else:
-        return str(self)
+  ErrorKey = ErrorKey
 
-    @property
-    def comps(self):
-      return self._comps
-
-  def _keyGen(self, key_type, desc, path, name=None, keys=None):
+  def _keyGen(self, key_type, desc, path, comps, name=None, keys=None):
     if key_type == ERRORKEY_DEFAULTKEYS[0]:
-      class BaseKey(self.ErrorKey):
-        pass
-      return BaseKey(desc=desc, path=path, name=name, keys=keys)
+      return BaseKey(desc=desc, path=path, name=name, keys=keys, _comps=comps)
 
     elif key_type == ERRORKEY_DEFAULTKEYS[1]:
-      class LocalKey(self.ErrorKey):
-        pass
-      return LocalKey(desc=desc, path=path, name=name, keys=keys)
+      return LocalKey(desc=desc, path=path, name=name, keys=keys, _comps=comps)
 
     elif key_type == ERRORKEY_DEFAULTKEYS[2]:
-      class MessageKey(self.ErrorKey):
-        def __init__(self, **kwargs):
-          super(MessageKey, self).__init__(**kwargs)
-          self.argcount = self.message.count('%s') if hasattr(
-            self, 'message') else 0
-      return MessageKey(message=desc, _location=path)
+      return MessageKey(message=desc, _location=path, _comps=comps)
+
+  _INSTANCE = None  # The one manager; see __new__.
+
+  def __new__(cls):
+    # The key tree depends only on the err_msg files, so every
+    # ErrorMsgManager() shares one instance and builds it once.
+    if cls._INSTANCE is None:
+      cls._INSTANCE = super(ErrorMsgManager, cls).__new__(cls)
+    return cls._INSTANCE
 
   def __init__(self):
-    # Read core.errors_old.err_msg directory; Count each file as a BaseKey
+    if 'as_list' in self.__dict__:
+      return  # Already built by an earlier ErrorMsgManager() call.
+    # Importing core.errors_old.err_msg registers its pages; each is a BaseKey
     location = file_util.SitRep(__file__)
     msg_path = location.rel_thisdir+'/err_msg'
-    self.as_list = file_util.searchDirectory(msg_path)
-    self.base = __import__(msg_path.replace('/', '.'),
-                           fromlist=self.as_list)
+    self.base = importlib.import_module(msg_path.replace('/', '.'))
+    self._flat = {}  # 'BASE[.LOCAL[.MSG]]' -> key object; see getKeyFromString.
+    self._resolved = {}  # Key string -> defaulted MessageKey.
+    self._all_messages = None  # Built on first access; see all.
+    self.as_list = [name.rsplit('.', 1)[-1] for name in registered_error_bases()]
 
     # Ensure 'system.py' file is there.
     system_check = ERRORKEY_SYSTEM_DEFAULTKEYS[0] in [x.upper() for x in
                                                       self.as_list]
     if system_check:
-      # Iterate through each BaseKey
-      for base_key in self.as_list:
-        # Import base_key
-        base_data = getattr(self.base, base_key)
-        desc, loc = base_data.__doc__, base_data.LOCATION
-        local_keys = [x for x in dir(base_data) if not x.startswith('_') and
-                      x == x.upper() and x.lower() != 'location']
-
-        # Add default LocalKey (if not already there)
-        if ERRORKEY_SYSTEM_DEFAULTKEYS[1] not in local_keys:
-          local_keys.append(ERRORKEY_SYSTEM_DEFAULTKEYS[1])
-
-        # Create BaseKey Object
-        basekey_obj = self._keyGen(ERRORKEY_DEFAULTKEYS[0], desc, location, base_key.upper(), local_keys)
-        setattr(self, base_key.upper(), basekey_obj)
-        setattr(getattr(self, base_key.upper()), '_comps', [base_key.upper()])
-
-        # Iterate through each local key of the BaseKey
-        for local_key in local_keys:
-          # Import local key data
-          if local_key == ERRORKEY_SYSTEM_DEFAULTKEYS[1] and not hasattr(base_data, local_key):
-            desc = 'Default local_key for {0} Object.'.format(base_key.upper())
-            # loc = previously assigned loc from base
-            messages = []
-            message_keys = []
-          else:
-            local_key_data = getattr(base_data, local_key)
-            desc, loc = local_key_data.desc, local_key_data.location
-            messages = local_key_data.messages
-            message_keys = [x.key for x in messages]
-
-          # Add default MessageKey (if not already there)
-          if ERRORKEY_SYSTEM_DEFAULTKEYS[2] not in message_keys:
-            message_keys.append(ERRORKEY_SYSTEM_DEFAULTKEYS[2])
-            messages.append(errmsg(key=ERRORKEY_SYSTEM_DEFAULTKEYS[2],
-                                   value='Default MessageKey for {0}.{1} base/'
-                                         'localkey'.format(base_key.upper(),
-                                                           local_key)))
-
-          # Create LocalKey Object
-          localkey_obj = self._keyGen(ERRORKEY_DEFAULTKEYS[1], desc, loc, local_key, message_keys)
-          setattr(basekey_obj, local_key, localkey_obj)
-          setattr(getattr(basekey_obj, local_key), '_comps', [base_key.upper(), local_key])
-
-          # Iterate through each message of the LocalKey
-          for message in messages:
-            location = '.'.join([base_key.upper(), local_key, message.key])
-
-            # Create MessageKey Object
-            msg_obj = self._keyGen(ERRORKEY_DEFAULTKEYS[2], message.value, location)
-            setattr(localkey_obj, message.key, msg_obj)
-            setattr(getattr(localkey_obj, message.key), '_comps', [base_key.upper(), local_key, message.key])
-
+      # Each page becomes a BaseKey the first time it is accessed.
+      self._pending = dict((intern(base_key.upper()), base_key)
+                           for base_key in self.as_list)
       self.as_list = [x.upper() for x in self.as_list]
     else:
-      print 'CRITICAL FAILURE!!! MISSING SYSTEM.PY FILE IN "core.errors_old.err_msg"'
-      print 'Exiting...'
+      print('CRITICAL FAILURE!!! MISSING SYSTEM.PY FILE IN "core.errors_old.err_msg"')
+      print('Exiting...')
       sys.exit(0)
 
+  def __getattr__(self, name):
+    """Builds a pending BaseKey (and its LocalKeys/MessageKeys) on first access."""
+    pending = self.__dict__.get('_pending')
+    if pending and name in pending:
+      try:
+        basekey_obj = self._buildBaseKey(name, pending[name])
+      except Exception:
+        # Leave it pending, so the next access retries and re-raises the
+        # real error instead of finding a half-built BaseKey.
+        self._discardBaseKey(name)
+        raise
+      del pending[name]
+      return basekey_obj
+    raise AttributeError(name)
+
+  def _discardBaseKey(self, name):
+    """Removes whatever a failed _buildBaseKey attached for BaseKey name."""
+    self.__dict__.pop(name, None)
+    prefix = name + '.'
+    for path in [path for path in self._flat
+                 if path == name or path.startswith(prefix)]:
+      del self._flat[path]
+
+  def _buildBaseKey(self, base_name, base_key):
+    # Import base_key
+    base_data = getattr(self.base, base_key)
+    desc, loc = base_data.__doc__, base_data.LOCATION
+    local_keys = sorted(base_data.LOCAL_KEYS)  # Registered by the page.
+
+    # Add default LocalKey (if not already there)
+    if ERRORKEY_SYSTEM_DEFAULTKEYS[1] not in local_keys:
+      local_keys.append(ERRORKEY_SYSTEM_DEFAULTKEYS[1])
+
+    # Create BaseKey Object
+    basekey_obj = self._keyGen(ERRORKEY_DEFAULTKEYS[0], desc, loc,
+                               (base_name,), base_name, local_keys)
+    setattr(self, base_name, basekey_obj)
+    self._flat[base_name] = basekey_obj
+
+    # Iterate through each local key of the BaseKey
+    for local_key in local_keys:
+      # Import local key data
+      if local_key == ERRORKEY_SYSTEM_DEFAULTKEYS[1] and not hasattr(base_data, local_key):
+        desc = 'Default local_key for {0} Object.'.format(base_name)
+        # loc = previously assigned loc from base
+        messages = []
+        message_keys = []
+      else:
+        local_key_data = getattr(base_data, local_key)
+        desc, loc = local_key_data.desc, local_key_data.location
+        messages = local_key_data.messages
+        message_keys = [x.key for x in messages]
+
+      # Add default MessageKey (if not already there)
+      if ERRORKEY_SYSTEM_DEFAULTKEYS[2] not in message_keys:
+        message_keys.append(ERRORKEY_SYSTEM_DEFAULTKEYS[2])
+        messages.append(errmsg(key=ERRORKEY_SYSTEM_DEFAULTKEYS[2],
+                               value='Default MessageKey for {0}.{1} base/'
+                                     'localkey'.format(base_name,
+                                                       local_key)))
+
+      # Create LocalKey Object
+      localkey_obj = self._keyGen(ERRORKEY_DEFAULTKEYS[1], desc, loc,
+                                  (base_name, local_key), local_key,
+                                  message_keys)
+      setattr(basekey_obj, local_key, localkey_obj)
+      self._flat['.'.join([base_name, local_key])] = localkey_obj
+
+      # Iterate through each message of the LocalKey
+      for message in messages:
+        location = intern('.'.join([base_name, local_key, message.key]))
+
+        # Create MessageKey Object
+        msg_obj = self._keyGen(ERRORKEY_DEFAULTKEYS[2], message.value, location,
+                               (base_name, local_key, message.key))
+        setattr(localkey_obj, message.key, msg_obj)
+        self._flat[location] = msg_obj
+
+    return basekey_obj
+
   def __repr__(self):
     return _repr_('ErrorMsgManager', self.as_list)
 
-  def _dummyMsgKey(self):
-    return self._keyGen('msgkey', '', '')
-
   def _defaultKey(self, key=None, errors=None, **defaults):
     """Augments 'lazy' keychain with default settings.
     Args:
@@ -196,55 +305,63 @@ class ErrorMsgManager(object):
         defaults: dict, default key settings for Object    
     """
 
-    write_error = errors is not None
-
-    extra = list(set(defaults.keys()) - set(ERRORKEY_DEFAULTKEYS))
-    if extra and write_error:
-        errors.Add(ErrMsg.ERROR.VALIDATION.UNEXPECTED_DEFAULTKEY, extra)
-    keys = []
-    for i in xrange(3):
-      if ERRORKEY_DEFAULTKEYS[i] in defaults.keys():
-        keys.append(defaults[ERRORKEY_DEFAULTKEYS[i]])
+    if isinstance(key, MessageKey):
+      return key  # Already a full keychain; nothing to default.
+
+    if errors is not None:
+      extra = [k for k in defaults if k not in _DEFAULTKEY_NAMES]
+      if extra:
+        errors.Add(ErrMsg.ERROR.GENERIC.UNEXPECTED_DEFAULT, extra)
+    base_name, local_name, msg_name = [
+        defaults.get(k, default) for k, default
+        in zip(ERRORKEY_DEFAULTKEYS, ERRORKEY_SYSTEM_DEFAULTKEYS)]
+
+    if key is self or key is None:
+      key = getattr(self, base_name, None)
+    # Walk down the keychain, one level per pass, until a MessageKey.
+    while isinstance(key, ErrorKey):
+      if isinstance(key, MessageKey):
+        return key
+      if local_name in key.keys:
+        key = getattr(key, local_name)
+      elif msg_name in key.keys:
+        key = getattr(key, msg_name)
       else:
-        keys.append(ERRORKEY_SYSTEM_DEFAULTKEYS[i])
+        return None
 
-    if self._validMessageKey(key):
-      return key
-
-    elif key == self or key is None:
-      return self._defaultKey(getattr(ErrMsg, keys[0]), errors, **defaults)
-
-    elif self._validateKey(key):
-      if keys[1] in key.keys:
-        return self._defaultKey(getattr(key, keys[1]), errors, **defaults)
-      if keys[2] in key.keys:
-        return self._defaultKey(getattr(key, keys[2]), errors, **defaults)
-
-    elif write_error:
-      errors.Add(ErrMsg.ERROR.VALIDATION.INVALIDKEY, key)
+    if errors is not None:
+      errors.Add(_ERR_INVALIDKEY, key)
 
 
   def _validMessageKey(self, key, errors=None):
-    testkey = self._dummyMsgKey()
-    if self._validateKey(key) and type(key).__name__ == type(testkey).__name__:
+    if isinstance(key, MessageKey):
       return True
     elif errors is not None:
       try:
-        errors.Add(ErrMsg.ERROR.VALIDATION.INVALIDKEY, str(key))
-      except Exception, e:
-        errors.Add(ErrMsg.ERROR.VALIDATION.UNKNOWN, e)
+        errors.Add(_ERR_INVALIDKEY, str(key))
+      except Exception as e:
+        errors.Add(_ERR_UNKNOWN, e)
     return False
 
   def getKeyFromString(self, key_str, errors=None):
     """convert dot-based string into Key."""
+    resolved = self._resolved.get(key_str)
+    if resolved is not None:
+      return resolved
+    if key_str in self._flat:
+      # Only keychains in the (fixed) tree are cached, so this stays bounded.
+      resolved = self._resolved[key_str] = self._defaultKey(self._flat[key_str])
+      return resolved
     if key_str:
+      # Not built yet, or not a keychain; walk it (building BaseKeys on demand).
       comps = key_str.split('.')
       new_key = self
       for key in comps:
-        if hasattr(new_key, key):
-          new_key=getattr(new_key, key)
+        child = getattr(new_key, key, None)
+        if child is not None:
+          new_key = child
         elif isinstance(errors, Errors):
-          errors.Add(ErrMsg.ERROR.VALIDATION.INVALIDKEY, key)
+          errors.Add(_ERR_INVALIDKEY, key)
           return None
         else:
           return None
@@ -253,116 +370,156 @@ class ErrorMsgManager(object):
       return None
 
   def _validateKey(self, key):
-    return issubclass(key.__class__, self.ErrorKey)
+    return isinstance(key, ErrorKey)
 
   @property
   def all(self):
-      all_messages = collections.OrderedDict()
+      """Ordered dict of every MessageKey to its message, built on first access."""
+      if self._all_messages is None:
+          self._all_messages = self._computeAll()
+      return self._all_messages
+
+  def _computeAll(self):
+      all_messages = _OrderedDict()
       for basekey in sorted(self.as_list):
           base = getattr(self, basekey)
           for localkey in sorted(base.keys):
               local = getattr(base, localkey)
               for msgkey in sorted(local.keys):
-                  msg = getattr(local, msgkey).message
-                  keychain = self.getKeyFromString('.'.join([basekey, localkey, msgkey]))
-                  all_messages[str(keychain)] = msg
+                  # The triple is complete, so the MessageKey is the keychain.
+                  keychain = getattr(local, msgkey)
+                  all_messages[str(keychain)] = keychain.message
       return all_messages
 
 
 
 
 ErrMsg = ErrorMsgManager()
+# Keys the error paths report with; the key tree is fixed, so bind them once.
+_ERR_INVALIDKEY = ErrMsg.ERROR.VALIDATION.INVALIDKEY
+_ERR_UNKNOWN = ErrMsg.ERROR.VALIDATION.UNKNOWN
+_ERR_INVALID_MSGFORMAT = ErrMsg.ERROR.ADD.INVALID_MSGFORMAT
+_ERR_INVALID_ERRORKEY = ErrMsg.ERROR.ADD.INVALID_ERRORKEY
+
 
 class Errors(object):
   DEFAULT_FMT = '\n'.join
 
   def __init__(self):
+    # Flat {(basekey, localkey, msgkey): [messages]}; key._comps is the key.
     self._errors = {}
+    self._sorted_keys = []  # _errors' keys, kept sorted as they are added.
+    # The same lists indexed {basekey: {localkey: {msgkey: [messages]}}}.
+    self._by_base = {}
+    self._version = 0  # Bumped on every change to _errors.
+    self._views = (None, None, None)  # (version, condensed, consists_of)
+
+  def _messages(self, comps):
+    """Returns the message list for comps, filing a new one if needed."""
+    msglist = self._errors.get(comps)
+    if msglist is None:
+      msglist = self._file(comps, [])
+      bisect.insort(self._sorted_keys, comps)
+    return msglist
+
+  def _file(self, comps, msglist):
+    """Files msglist under comps in both _errors and _by_base."""
+    basekey, localkey, msgkey = comps
+    self._errors[comps] = msglist
+    local = self._by_base.setdefault(basekey, {}).setdefault(localkey, {})
+    local[msgkey] = msglist
+    return msglist
+
+  def _nested(self):
+    """Returns a copy of _by_base whose dicts callers may change freely."""
+    return dict((basekey, dict((localkey, dict(local))
+                               for localkey, local in six.iteritems(base)))
+                for basekey, base in six.iteritems(self._by_base))
 
   def __nonzero__(self):
     return bool(self._errors)
 
+  __bool__ = __nonzero__
+
   def __contains__(self, key):
-    return key in self._errors
+    return key in self._by_base
 
   def __len__(self):
-    return sum(len(messages) for messages in self._errors.itervalues())
+    return sum(map(len, six.itervalues(self._by_base)))
 
   def __iter__(self):
-    return iter(self._errors)
+    return iter(self._by_base)
 
   def __repr__(self):
-    return '<Errors: %s>' % pprint.pformat(dict(self._errors))
+    return '<Errors: %s>' % json.dumps(self._by_base,
+                                        indent=2, sort_keys=True, default=str)
 
   @property
   def count(self):
-    return sum(len(x) for x in self.condensed.values())
+    return sum(map(len, six.itervalues(self._errors)))
 
   @property
   def condensed(self):
     """Condenses nested dict to single dict."""
-    condensed = {}
-    key_format = '{0}_{1}_{2}'
-    for basekey, basevalue in sorted(self._errors.iteritems()):
-      for localkey, localvalue in sorted(basevalue.iteritems()):
-        for msgkey, msglist in sorted(localvalue.iteritems()):
-          new_key = key_format.format(basekey, localkey, msgkey)
-          condensed[new_key] = msglist
-    return condensed
+    # A copy, so changes by the caller don't leak into the cached view.
+    return dict(self._buildViews()[1])
 
   @property
   def consists_of(self):
-    d = collections.defaultdict(list)
-    for basekey, basevalue in sorted(self._errors.iteritems()):
-      d[ERRORKEY_DEFAULTKEYS[0]].append(basekey)
-      for localkey, localvalue in sorted(basevalue.iteritems()):
-        d[ERRORKEY_DEFAULTKEYS[1]].append('.'.join([basekey, localkey]))
-        for msgkey, _ in sorted(localvalue.iteritems()):
-          d[ERRORKEY_DEFAULTKEYS[2]].append('.'.join([basekey, localkey, msgkey]))
-    return dict(d)
+    d = self._buildViews()[2]
+    return dict((tag, list(names)) for tag, names in six.iteritems(d))
 
-  @property
-  def display(self):
-    d = ''
-    for basekey, basevalue in sorted(self._errors.iteritems()):
-      d += basekey + '\n'
-      for localkey, localvalue in sorted(basevalue.iteritems()):
-        d += ' ' * 4 + localkey + '\n'
-        for msgkey, msglist in sorted(localvalue.iteritems()):
-          temp_list = copy.copy(msglist)
-          first_msg = temp_list.pop(0)
-          d += '{0}{1}: {2}'.format(' ' * 10, msgkey, first_msg) + '\n'
-          for msg in temp_list:
-            d += ' ' * (12 + len(msgkey)) + msg + '\n'
-          d += '\n'
-    return d
-
-  def _keychainExists(self, key, create_new=False):
-    """Confirms if key already exists in error dictionary.
-    Args:
-        key, an ErrorKey subclass, key to be searched.
-        create_new: bool, if key doesn't exist in error, create new one.
+  def _buildViews(self):
+    """Builds condensed and consists_of in one sorted sweep of _errors.
+
+    The result is kept until _errors next changes (see _version).
     """
-    if ErrMsg._validateKey(key):
-      curr_dict = self._errors
+    if self._views[0] != self._version:
+      condensed = {}
+      key_format = '{0}_{1}_{2}'
+      d = collections.defaultdict(list)
+      base_tag, local_tag, msg_tag = ERRORKEY_DEFAULTKEYS[:3]
+      last_base = last_local = None
+      for comps in self._sorted_keys:
+        basekey, localkey, msgkey = comps
+        if basekey != last_base:
+          d[base_tag].append(basekey)
+          last_base, last_local = basekey, None
+        if localkey != last_local:
+          d[local_tag].append('.'.join([basekey, localkey]))
+          last_local = localkey
+        condensed[key_format.format(basekey, localkey, msgkey)] = self._errors[comps]
+        d[msg_tag].append('.'.join(comps))
+      self._views = (self._version, condensed, dict(d))
+    return self._views
 
-      for i, comp in enumerate(str(key).split('.')):
-        create_type = dict if i < 2 else list
-        if comp in curr_dict.keys():
-          curr_dict = curr_dict[comp]
-        else:
-          if create_new:
-            curr_dict[comp] = create_type()
-            curr_dict = curr_dict[comp]
-          else:
-            return False
-      return True
+  @property
+  def display(self):
+    parts = []
+    append = parts.append
+    errors = self._errors
+    by_base, by_local = operator.itemgetter(0), operator.itemgetter(1)
+    for basekey, base_group in itertools.groupby(self._sorted_keys, by_base):
+      append(basekey + '\n')
+      for localkey, local_group in itertools.groupby(base_group, by_local):
+        append(' ' * 4 + localkey + '\n')
+        for comps in local_group:
+          msgkey, msglist = comps[2], errors[comps]
+          append('{0}{1}: {2}\n'.format(' ' * 10, msgkey, msglist[0]))
+          indent = ' ' * (12 + len(msgkey))
+          for msg in itertools.islice(msglist, 1, None):
+            append(indent + msg + '\n')
+          append('\n')
+    return ''.join(parts)
 
   def isError(self, obj):
     return isinstance(obj, Errors) or issubclass(obj, Errors)
 
   def Clear(self):
     self._errors = {}
+    self._sorted_keys = []
+    self._by_base = {}
+    self._version += 1
 
 
   def Get(self, key):
@@ -377,14 +534,14 @@ class Errors(object):
     """
     if not key:
       key = ERRORKEY_SYSTEM_DEFAULTKEYS[0]
-    messages = self._errors.get(key)
+    messages = self._by_base.get(key)
     if messages:
       return list(messages)
     return None
 
   def GetAll(self):
     """Gets a copy of the internal errors_old dictionary."""
-    return self._errors.copy()
+    return self._nested()
 
   def Add(self, key, *messages):
     """Associates one or more messages with a given key_bk.
@@ -396,17 +553,14 @@ class Errors(object):
       *messages: additional messages to associate with the key_bk.
     """
     if ErrMsg._validMessageKey(key):
-      if not self._keychainExists(key):
-        self._keychainExists(key, True)
-
-      basekey, localkey, msgkey = str(key).split('.')
-
       if key.argcount == len(messages):
-        self.message = key.message % messages
-        self._errors[basekey][localkey][msgkey].append(self.message)
+        # No args means no '%s' slots: the message is already final.
+        message = key.format(messages) if messages else key.message
+        self._messages(key._comps).append(message)
+        self._version += 1
 
       else:
-        self.Add(ErrMsg.ERROR.ADD.INVALID_MSGFORMAT, key.message, messages)
+        self.Add(_ERR_INVALID_MSGFORMAT, key.message, messages)
     elif ErrMsg._validateKey(key):
       # Assume GENERIC status
       temp_error = Errors()
@@ -416,7 +570,7 @@ class Errors(object):
       else:
         self.Add(key, messages)
     else:
-      self.Add(ErrMsg.ERROR.ADD.INVALID_ERRORKEY, key.message, messages)
+      self.Add(_ERR_INVALID_ERRORKEY, key.message, messages)
 
   def AsJson(self):
     """Gets a JSON string representation of the error object.
@@ -431,7 +585,7 @@ class Errors(object):
       A JSON string of key_bk/messages pairs.
     """
 
-    return json.dumps(self._errors)
+    return _dumps(self._by_base)
 
   def Merge(self, other):
     """Adds all errors_old from another Errors object to this one.
@@ -440,17 +594,17 @@ class Errors(object):
       other: an Errors instance to merge into this one.
     """
     if self.isError(other):
-      for basekey, basevalue in other._errors.iteritems():
-        for localkey, localvalue in basevalue.iteritems():
-          for msgkey, msglist in localvalue.iteritems():
-            keychain = ErrMsg.getKeyFromString('.'.join([basekey, localkey,
-                                                         msgkey]))
-
-            # Use keychainExists flag to create chain in self if it doesn't
-            # already exist.
-            self._keychainExists(keychain, True)
-            for msg in msglist:
-              self._errors[basekey][localkey][msgkey].append(msg)
+      if not other._errors:
+        return
+      self._version += 1
+      if not self._errors:
+        # Nothing to merge into; copy the other table in one go.
+        for comps in other._sorted_keys:
+          self._file(comps, list(other._errors[comps]))
+        self._sorted_keys = list(other._sorted_keys)
+        return
+      for comps, msglist in six.iteritems(other._errors):
+        self._messages(comps).extend(msglist)
 
   def Raise(self, exception, key, message, *messages):
     """Adds error message(s) and raises the given exception."""
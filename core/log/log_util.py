@@ -1,6 +1,7 @@
 """Basic Logging class and utilities."""
 
 import logging
+import time
 
 from core._system import constants
 from core.base.core_enum import Enum
@@ -19,6 +20,39 @@ class LogTypes(Enum):
   CRITICAL=5
 
 _DEFAULT_LOG_LEVEL = LogTypes.INFO
+_NAME_TO_LEVEL = dict((t.name, t) for t in LogTypes)
+_INT_TO_LEVEL = dict((t.number, t) for t in LogTypes)
+
+# write() keyword arguments that select the log level (case-insensitive).
+_LVL_KEYS = frozenset(('level', 'lvl', 'logtype', 'log_type'))
+
+_TEMPLATES = {}
+_TEMPLATES_MAX = 256
+
+
+def _splitTemplate(msg):
+  """Splits a log template on its '{}' placeholders, memoized per template.
+
+  Args:
+    msg: str, log message template.
+  Returns:
+    (placeholder count, list of literal parts).  The parts are None when the
+    template uses other format syntax (indexed/named fields, escaped braces),
+    in which case the caller has to fall back to str.format.
+  """
+  try:
+    return _TEMPLATES[msg]
+  except KeyError:
+    pass
+  parts = msg.split('{}')
+  count = len(parts) - 1
+  if any('{' in part or '}' in part for part in parts):
+    parts = None
+  if len(_TEMPLATES) >= _TEMPLATES_MAX:
+    _TEMPLATES.clear()
+  _TEMPLATES[msg] = template = (count, parts)
+  return template
+
 
 class Log(logging.getLoggerClass()):
 
@@ -28,7 +62,6 @@ class Log(logging.getLoggerClass()):
   def __init__(self, user=None):
     self._ready = False
     self._initLogs(user)
-    self._initDataConnection()
     self._initLogHandlers()
 
   def _initLogs(self, user):
@@ -42,10 +75,12 @@ class Log(logging.getLoggerClass()):
     self.extra = {'user': self.user, 'clientip': self.client_ip}
 
     # Establish Logging Repo (self.log_file : core_utils.file_utils.File object).
-    self.log_file = self._initDataConnection()
+    # One clock read serves both the file path and the start marker.
+    now_utc = datetime_util.now(True)
+    self.log_file = self._initDataConnection(now_utc)
     if self.log_file.path_exists and not self.log_file.file_exists:
-      self.log_file.Append(err_msg.LOG_START.format(datetime_util.now(),
-                                                    datetime_util.now(True)))
+      self.log_file.Append(err_msg.LOG_START.format(
+          now_utc.astimezone(constants.LOCAL_TIMEZONE), now_utc))
 
   def _initLogHandlers(self):
 
@@ -63,6 +98,8 @@ class Log(logging.getLoggerClass()):
     sh.setFormatter(format)
     self.logger.addHandler(fh)
     self.logger.addHandler(sh)
+    # Log files are per UTC hour, which lines up with epoch hour boundaries.
+    self._next_rollover = (int(time.time()) // 3600 + 1) * 3600
     self.ready = True
     if self._issystem:
       self.logger.info('{} Logging operations initialized'.format(self._logname), extra=self.extra)
@@ -81,16 +118,19 @@ class Log(logging.getLoggerClass()):
       self.logger.removeHandler(handle)
     self.ready = False
 
-  def _initDataConnection(self):
+  def _initDataConnection(self, now_utc=None):
     """Creates Path for Log Files.
 
     Path format: /data/logs/<system:user>/<YYYY>/<MM>/<DD>/
     File format: <HH>.log
+
+    Args:
+      now_utc: datetime, UTC time the log file is for; defaults to now.
     """
     data_path = 'data/logs'
     data_path += '/system' if self._issystem else '/users'
 
-    date_dict = datetime_util.asDict(datetime_util.now(True))
+    date_dict = datetime_util.asDict(now_utc or datetime_util.now(True))
     log_path = '/{0}/{1}/{2}'.format(date_dict['yr'], date_dict['mo'], date_dict['dy'])
 
     log_file = '{0}.log'.format(date_dict['hr'])
@@ -109,27 +149,19 @@ class Log(logging.getLoggerClass()):
     Returns:
       log_type: LogTypes<Enum> object
     """
-    log_type = None
-    if isinstance(val, str):
-      if val.upper() in [x.name for x in LogTypes]:
-        log_type = LogTypes[val.upper()]
-    elif isinstance(val, int):
-      if val % 10 == 0:
-        log_type = self._convertLogLevel(val/10)
-      elif 0 <= val <= 5:
-        log_type = LogTypes(val)
-      else:
-        log_type = _DEFAULT_LOG_LEVEL
-    elif isinstance(val, type(LogTypes.INFO)):
-      # fall-thru -- don't alter
-      log_type = val
-    else:
-      log_type = _DEFAULT_LOG_LEVEL
-    return log_type
+    t = type(val)
+    if t is str:
+      return _NAME_TO_LEVEL.get(val.upper(), _DEFAULT_LOG_LEVEL)
+    if t is int:
+      # Accept stdlib logging levels (10, 20, ...) as well as 0-5.
+      return _INT_TO_LEVEL.get(val % 10 and val or val // 10, _DEFAULT_LOG_LEVEL)
+    if t is LogTypes:
+      return val
+    return _DEFAULT_LOG_LEVEL
 
   def _validMsgArgs(self, msg, *args):
     """Ensure msg contains same # of placeholders as len(args)."""
-    return msg.count('{}') <= len(args) and msg
+    return _splitTemplate(msg)[0] <= len(args) and msg
 
   def _getLogLevelMethod(self, lvl):
     """Retrieve logging action based on input.
@@ -146,27 +178,34 @@ class Log(logging.getLoggerClass()):
     return None
 
   def write(self, msg=None, *args, **kwargs):
-    if datetime_util.now(True).hour != self.log_hour:
+    if time.time() >= self._next_rollover:
       self.ready = False
       self._closeHandlers()
 
     if not self.ready:
       self._initLogs(self.user)
-      self._initDataConnection()
       self._initLogHandlers()
 
     lvl = None
-    for key in ['level', 'lvl', 'logtype', 'log_type']:
-      if key in [x.lower() for x in kwargs.keys()]:
-        lvl = [v for k, v in kwargs.iteritems() if k.lower() == key][0]
+    for key in [k for k in kwargs if k.lower() in _LVL_KEYS]:
+      # Pop it: logger methods don't accept a level keyword.
+      lvl = kwargs.pop(key)
     kwargs['extra'] = self.extra
     lvl = getattr(logging, self._convertLogLevel(lvl).name)
     write_func = self._getLogLevelMethod(lvl)
     if self._validMsgArgs(msg, *args) and write_func:
-      msg = msg.format(*args) if args else msg
+      parts = _splitTemplate(msg)[1] if args else None
+      if parts is not None:
+        out = [parts[0]]
+        for arg, part in zip(args, parts[1:]):
+          out.append(str(arg))
+          out.append(part)
+        msg = ''.join(out)
+      elif args:
+        msg = msg.format(*args)
       write_func(msg, **kwargs)
     else:
-      msg = err_msg.LOG_MSG_MISMATCH.format(msg, msg.count('{}'), args, kwargs)
+      msg = err_msg.LOG_MSG_MISMATCH.format(msg, _splitTemplate(msg)[0], args, kwargs)
       self.logger.debug(msg, extra=self.extra)
 
 SYSLOG = Log('system')
@@ -62,8 +62,10 @@ class ModelAdapter(datastore_rpc.AbstractAdapter):
 
   def pb_to_index(self, pb):
     index_def = pb.definition()
-    properties = [IndexProperty(name=prop.name(),
-                                direction=_DIR_MAP[prop.direction()])
+    # Bind the class and map locally; they are looked up once per property.
+    index_property, dir_map = IndexProperty, _DIR_MAP
+    properties = [index_property(name=prop.name(),
+                                 direction=dir_map[prop.direction()])
                   for prop in index_def.property_list()]
     index = Index(kind=index_def.entity_type(),
                   properties=properties,
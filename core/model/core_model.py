@@ -283,6 +283,8 @@ subclassed to suit various needs.  Documentation for writing a
 Property subclass is in the docstring for the Property class.
 """
 
+import collections
+
 from core.model.property.base_property import *
 from core.model.core_model_utils import *
 from core.errors_old.core_error import *
@@ -324,6 +326,8 @@ Key = key_module.Key  # For export.
 class IndexProperty(_NotEqualMixin):
   """Immutable object representing a single property in an index."""
 
+  __slots__ = ('__name', '__direction')
+
   @utils.positional(1)
   def __new__(cls, name, direction):
     """Constructor."""
@@ -361,6 +365,8 @@ class IndexProperty(_NotEqualMixin):
 class Index(_NotEqualMixin):
   """Immutable object representing an index."""
 
+  __slots__ = ('__kind', '__properties', '__ancestor')
+
   @utils.positional(1)
   def __new__(cls, kind, properties, ancestor):
     """Constructor."""
@@ -408,6 +414,8 @@ class Index(_NotEqualMixin):
 class IndexState(_NotEqualMixin):
   """Immutable object representing and index and its state."""
 
+  __slots__ = ('__definition', '__state', '__id')
+
   @utils.positional(1)
   def __new__(cls, definition, state, id):
     """Constructor."""
@@ -458,6 +466,33 @@ class IndexState(_NotEqualMixin):
 # A custom 'meaning' for compressed properties.
 _MEANING_URI_COMPRESSED = 'ZLIB'
 
+# Model constructor keywords that configure the key_bk or projection rather
+# than set a property, with their underscore-prefixed aliases; see
+# Model.__get_arg().
+_MODEL_META_KWDS = frozenset(
+    prefix + kwd
+    for kwd in ('key_bk', 'id', 'app', 'namespace', 'parent', 'projection')
+    for prefix in ('', '_'))
+
+# Map of {protobuf property name: tuple of its dotted parts}; see
+# _split_property_name().
+_property_name_parts = {}
+_PROPERTY_NAME_PARTS_MAX = 1024
+
+
+def _split_property_name(name):
+  """Internal helper to split a dotted property name, with memoization.
+
+  Deserializing repeats the same few names once per entity (and once per
+  value of a repeated property), so the split is cached by name.
+  """
+  parts = _property_name_parts.get(name)
+  if parts is None:
+    if len(_property_name_parts) >= _PROPERTY_NAME_PARTS_MAX:
+      _property_name_parts.clear()
+    parts = _property_name_parts[name] = tuple(name.split('.'))
+  return parts
+
 
 class MetaModel(type):
   """Metaclass for Model.
@@ -508,6 +543,7 @@ class Model(_NotEqualMixin):
 
   # Class variables updated by _fix_up_properties()
   _properties = None
+  _serializers = ()  # _properties' bound _serialize methods, sorted by name.
   _has_repeated = False
   _kind_map = {}  # Dict mapping {kind: Model subclass}
 
@@ -547,13 +583,17 @@ class Model(_NotEqualMixin):
     # self is passed implicitly through args so users can define a property
     # named 'self'.
     (self,) = args
-    get_arg = self.__get_arg
-    key = get_arg(kwds, 'key_bk')
-    id = get_arg(kwds, 'id')
-    app = get_arg(kwds, 'app')
-    namespace = get_arg(kwds, 'namespace')
-    parent = get_arg(kwds, 'parent')
-    projection = get_arg(kwds, 'projection')
+    if _MODEL_META_KWDS.isdisjoint(kwds):
+      # Nothing to parse (e.g. the bare cls() from _from_pb()).
+      key = id = app = namespace = parent = projection = None
+    else:
+      get_arg = self.__get_arg
+      key = get_arg(kwds, 'key_bk')
+      id = get_arg(kwds, 'id')
+      app = get_arg(kwds, 'app')
+      namespace = get_arg(kwds, 'namespace')
+      parent = get_arg(kwds, 'parent')
+      projection = get_arg(kwds, 'projection')
     if key is not None:
       if (id is not None or parent is not None or
           app is not None or namespace is not None):
@@ -630,10 +670,12 @@ class Model(_NotEqualMixin):
     Raises:
       BadValueError if it finds any.
     """
-    baddies = self._find_uninitialized()
-    if baddies:
-      raise datastore_errors.BadValueError(
-          'Entity has uninitialized properties: %s' % ', '.join(baddies))
+    for prop in self._properties.itervalues():
+      if not prop._is_initialized(self):
+        # Only collect the full set of names once there is an error to report.
+        raise datastore_errors.BadValueError(
+            'Entity has uninitialized properties: %s' %
+            ', '.join(self._find_uninitialized()))
 
   def __repr__(self):
     """Return an unambiguous string representation of an entity."""
@@ -785,8 +827,15 @@ class Model(_NotEqualMixin):
       # TODO: Move the key_bk stuff into ModelAdapter.entity_to_pb()?
       self._key_to_pb(pb)
 
-    for unused_name, prop in sorted(self._properties.iteritems()):
-      prop._serialize(self, pb, projection=self._projection)
+    if self._properties is self.__class__._properties:
+      # Not cloned (see _clone_properties), so the class's list holds.
+      serializers = self._serializers
+    else:
+      serializers = [prop._serialize
+                     for _, prop in sorted(self._properties.iteritems())]
+    projection = self._projection
+    for serialize in serializers:
+      serialize(self, pb, projection=projection)
 
     return pb
 
@@ -822,33 +871,42 @@ class Model(_NotEqualMixin):
     if key is not None and (set_key or key.id() or key.parent()):
       ent._key = key
 
+    # Property names cannot contain periods, so a wire name that is a
+    # declared property name resolves to that property directly.
+    known_properties = ent._properties
     # NOTE(darke): Keep a map from (indexed, property name) to the property.
     # This allows us to skip the (relatively) expensive call to
     # _get_property_for for repeated fields.
     _property_map = {}
     projection = []
+    # Bind what the loop uses on every property to locals.
+    index_value = entity_pb.Property.INDEX_VALUE
+    get_property_for = ent._get_property_for
     for indexed, plist in ((True, pb.property_list()),
                            (False, pb.raw_property_list())):
       for p in plist:
-        if p.meaning() == entity_pb.Property.INDEX_VALUE:
-          projection.append(p.name())
-        property_map_key = (p.name(), indexed)
-        if property_map_key not in _property_map:
-          _property_map[property_map_key] = ent._get_property_for(p, indexed)
-        _property_map[property_map_key]._deserialize(ent, p)
+        name = p.name()
+        if p.meaning() == index_value:
+          projection.append(name)
+        prop = known_properties.get(name)
+        if prop is None:
+          # Structured (dotted) or unknown names.
+          property_map_key = (name, indexed)
+          prop = _property_map.get(property_map_key)
+          if prop is None:
+            prop = _property_map[property_map_key] = get_property_for(
+                p, indexed)
+        prop._deserialize(ent, p)
 
     ent._set_projection(projection)
     return ent
 
   def _set_projection(self, projection):
-    by_prefix = {}
+    by_prefix = collections.defaultdict(list)
     for propname in projection:
-      if '.' in propname:
-        head, tail = propname.split('.', 1)
-        if head in by_prefix:
-          by_prefix[head].append(tail)
-        else:
-          by_prefix[head] = [tail]
+      head, sep, tail = propname.partition('.')
+      if sep:
+        by_prefix[head].append(tail)
     self._projection = tuple(projection)
     for propname, proj in by_prefix.iteritems():
       prop = self._properties.get(propname)
@@ -859,7 +917,7 @@ class Model(_NotEqualMixin):
 
   def _get_property_for(self, p, indexed=True, depth=0):
     """Internal helper to get the property for a protobuf-level property."""
-    parts = p.name().split('.')
+    parts = _split_property_name(p.name())
     if len(parts) <= depth:
       # Apparently there's an unstructured value here.
       # Assume it is a None written for a missing value.
@@ -945,6 +1003,7 @@ class Model(_NotEqualMixin):
                         'a Unicode string (%r); please encode using utf-8' %
                         (cls.__name__, kind))
     cls._properties = {}  # Map of {name: property}
+    cls._serializers = ()
     if cls.__module__ == __name__:  # Skip the classes in *this* file.
       return
     for name in set(dir(cls)):
@@ -961,6 +1020,8 @@ class Model(_NotEqualMixin):
                attr._modelclass._has_repeated)):
             cls._has_repeated = True
           cls._properties[attr._name] = attr
+    cls._serializers = tuple(
+        prop._serialize for _, prop in sorted(cls._properties.iteritems()))
     cls._update_kind_map()
 
   @classmethod
@@ -8,6 +8,8 @@ from core.errors_old.core_error import *
 class _NotEqualMixin(object):
   """Mix-in class that implements __ne__ in terms of __eq__."""
 
+  __slots__ = ()  # Leaves room for slotted subclasses.
+
   def __ne__(self, other):
     """Implement self != other as not(self == other)."""
     eq = self.__eq__(other)
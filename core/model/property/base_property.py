@@ -1,3 +1,5 @@
+from six.moves import intern
+
 from core.model.core_model_utils import *
 from core import core_utils as utils
 from core.errors_old.core_error import *
@@ -355,9 +357,10 @@ class Property(ModelAttribute):
 
       foo = bar = baz = StringProperty()
     """
-    self._code_name = code_name
-    if self._name is None:
-      self._name = code_name
+    # Interned, since these names key every entity's _values and the
+    # model's _properties and are compared on every lookup.
+    self._code_name = intern(code_name)
+    self._name = intern(self._name) if self._name is not None else self._code_name
 
   def _store_value(self, entity, value):
     """Internal helper to store a value in an entity for a property.